@@ -8,10 +8,19 @@ import asyncio
 import os
 import json
 import logging
+import math
+import random
 import threading
 import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 import hashlib
+import itertools
+
+import numpy as np
 
 from livekit import rtc
 from livekit.agents import (
@@ -28,9 +37,12 @@ from livekit.plugins import silero, deepgram, cartesia, openai
 import re
 
 # OPTIMIZED: Turn detector loaded lazily to reduce cold start (saves ~300-500ms)
-# Moved from module-level import to on-demand loading in get_turn_detector()
-HAS_TURN_DETECTOR = None  # Will be set on first check
-_turn_detector_model = None
+# Plugin import is hoisted into prewarm (preload_turn_detector); the model itself
+# is constructed on demand in get_turn_detector() once a job context exists
+
+# Output Media client identity: 'output-media-{session_id}'. Matched in place,
+# case-insensitively, without building a lowercased copy per participant.
+_OUTPUT_MEDIA_IDENTITY = re.compile(r"output-media-", re.IGNORECASE)
 
 # Session greeting registry — prevents re-greeting on reconnect within same process
 _greeted_rooms: dict = {}
@@ -56,34 +68,126 @@ _CONVERSATIONAL_BYPASS_PHRASES: frozenset = frozenset({
     "no", "nope", "nah", "not really",
 })
 
+# Voice-output punctuation stripper — one translate table built at import instead
+# of compiling/looking up regexes on every announcement. Apostrophes (ASCII and
+# curly) are kept; curly double quotes from LLM output are dropped like '"'.
+_VOICE_PUNCT_TABLE = str.maketrans("", "", '.,!?;:-"()[]{}\u201c\u201d')
+
+# Mic diagnostics (count_audio_frames). dBFS = 20*log10(rms/32767); the "very
+# quiet" cut-off (-50 dBFS) is pre-squared so the check needs no log at all.
+_PCM16_FULL_SCALE = 32767
+_DB_PER_LN = 20.0 / math.log(10.0)
+_QUIET_MEAN_SQ = (_PCM16_FULL_SCALE * 10 ** (-50 / 20)) ** 2
+_RMS_SAMPLE_STRIDE = 4  # diagnostic RMS reads every Nth sample
+
+
+def _to_dbfs(rms: float) -> float:
+    """RMS of 16-bit PCM in dBFS (-100 for silence)."""
+    return _DB_PER_LN * math.log(rms / _PCM16_FULL_SCALE) if rms > 0 else -100
+
+# Pre-encoded heads for transcript data-channel frames — only the JSON-escaped
+# text is spliced in per event (no per-event dict + generic encoder pass).
+_TRANSCRIPT_USER_HEAD = b'{"type":"transcript.user","is_final":true,"text":'
+_TRANSCRIPT_ASSISTANT_HEAD = b'{"type":"transcript.assistant","text":'
+
+# Fixed agent-state frames, published as-is on every state change
+_STATE_LISTENING = b'{"type":"agent.state","state":"listening"}'
+_STATE_THINKING = b'{"type":"agent.state","state":"thinking"}'
+_STATE_SPEAKING = b'{"type":"agent.state","state":"speaking"}'
+_STATE_IDLE = b'{"type":"agent.state","state":"idle"}'
+
+# Data-channel frames buffered per session before stale agent.state frames are shed
+_PUBLISH_BACKLOG_MAX = 256
+
+# AgentState value -> frame. 1.3.x emits these plain strings, so a dict hit is
+# the normal path; _agent_state_name() covers enum-style values.
+_STATE_FRAMES = {
+    "thinking": _STATE_THINKING,
+    "speaking": _STATE_SPEAKING,
+    "listening": _STATE_LISTENING,
+    "idle": _STATE_IDLE,
+}
+
+
+def _agent_state_name(state) -> str:
+    """Normalise an unexpected state value (e.g. 'AgentState.THINKING') to a _STATE_FRAMES key."""
+    state_str = str(state).lower()
+    for name in _STATE_FRAMES:
+        if name in state_str:
+            return name
+    return state_str
+
+# JSON string literal as bytes for the transcript frames. orjson (when installed)
+# escapes and encodes in one C pass, returning bytes directly. Incoming data
+# packets are parsed straight from bytes the same way; orjson.JSONDecodeError
+# subclasses json.JSONDecodeError, so except clauses work with either parser.
+try:
+    import orjson as _orjson
+    _json_str_bytes = _orjson.dumps
+    _json_loads = _orjson.loads
+except ImportError:
+    def _json_str_bytes(text: str) -> bytes:
+        return json.dumps(text).encode()
+    _json_loads = json.loads
+
+# MEMORY SAVE ENFORCEMENT — static, so it sits in the cacheable prompt prefix
+_MEMORY_SAVE_RULE = (
+    "\n\n## MEMORY SAVE RULE (NON-NEGOTIABLE)\n"
+    "NEVER say 'saved', 'stored', 'noted', 'I'll remember that', or any save confirmation "
+    "UNTIL you have received a successful response from deepStore, updateUserProfile, or addContact. "
+    "The sequence is always: call tool → receive success response → then confirm to user. "
+    "If the user says 'remember X', 'save X', 'my favorite X is Y', 'note that' — "
+    "call deepStore immediately with the content and a descriptive label. "
+    "Do not ask permission. Do not delay. Call deepStore first, then confirm."
+)
+_NO_CATALOG_TEXT = (
+    "No connected services catalog available. Use manageConnections with action status to check what is connected."
+)
+# How long entrypoint waits for a still-running catalog prewarm before going on
+# without it. Short enough to be invisible, long enough to catch a near-done build.
+_CATALOG_WAIT_S = 0.2
+# How long entrypoint waits for the Output Media client to join and publish audio
+_CLIENT_WAIT_S = 300.0
 
+
+@lru_cache(maxsize=1)
 def get_turn_detector():
-    """Lazy-load turn detector model on first use (non-blocking)."""
-    global HAS_TURN_DETECTOR, _turn_detector_model
+    """Lazy-load turn detector model on first use; None if unavailable.
 
-    if HAS_TURN_DETECTOR is None:
-        try:
-            from livekit.plugins.turn_detector.multilingual import MultilingualModel
-            _turn_detector_model = MultilingualModel()
-            HAS_TURN_DETECTOR = True
-            logger.info("Turn detector loaded successfully (lazy)")
-        except ImportError:
-            HAS_TURN_DETECTOR = False
-            logger.info("Turn detector not available (not installed)")
-        except Exception as e:
-            HAS_TURN_DETECTOR = False
-            logger.warning(f"Turn detector initialization failed: {e}")
+    Memoized, so the model (or the failure) is resolved once per process with
+    no module globals to read half-written.
+    """
+    try:
+        from livekit.plugins.turn_detector.multilingual import MultilingualModel
+        model = MultilingualModel()
+        logger.info("Turn detector loaded successfully (lazy)")
+        return model
+    except ImportError:
+        logger.info("Turn detector not available (not installed)")
+    except Exception as e:
+        logger.warning("Turn detector initialization failed: %s", e)
+    return None
+
+
+def preload_turn_detector():
+    """Import the turn detector plugin ahead of the first job (called from prewarm).
+
+    Only the import (tokenizer + ONNX runtime modules) is hoisted: MultilingualModel()
+    binds to the running job's inference executor, so get_turn_detector() still
+    constructs it inside entrypoint. Must be called on the main thread — the
+    plugin registers itself on import, which livekit-agents rejects elsewhere.
+    """
+    try:
+        import livekit.plugins.turn_detector.multilingual  # noqa: F401
+        logger.info("Turn detector plugin preloaded")
+    except ImportError:
+        logger.info("Turn detector not available (not installed)")
+    except Exception as e:
+        logger.warning("Turn detector preload failed (will retry lazily): %s", e)
 
-    return _turn_detector_model if HAS_TURN_DETECTOR else None
 
 from .config import get_settings
-from .tools.email_tool import send_email_tool
-from .tools.database_tool import query_database_tool
-from .tools.vector_store_tool import store_knowledge_tool
-from .tools.google_drive_tool import search_documents_tool, get_document_tool, list_drive_files_tool, recall_drive_data_tool
 from .tools.agent_context_tool import (
-    query_context_tool,
-    get_session_summary_tool,
     warm_session_cache,
     invalidate_session_cache,
     set_current_session_id,
@@ -96,11 +200,14 @@ from .tools.tool_executor import (
     is_delegation_active as _is_delegation_active,
     register_session as _register_session,
     unregister_session as _unregister_session,
+    warm_fireworks_connection as _warm_fireworks_connection,
 )
 from .tools.user_profile_tool import set_user_mem_dir as _set_profile_mem_dir
 from .prompts import CONVERSATION_PROMPT
 from .tools.gamma_tool import get_notification_queue
 from .utils.logging import setup_logging
+from .utils.http_client import close_http_client
+from .utils.n8n_client import close_n8n_session
 from .utils.metrics import LatencyTracker
 from .utils.context_cache import get_cache_manager
 from .utils.async_tool_worker import AsyncToolWorker, set_worker
@@ -141,6 +248,171 @@ except Exception as _mem_err:
     _MEM_AVAILABLE = False
 
 
+# CONVERSATION_PROMPT split once around its catalog placeholder, so building the
+# base prompt is one join rather than a full-text search-and-replace. If the
+# template carries no placeholder, _PROMPT_CATALOG_MARK is "" and nothing is
+# spliced in (same result as the replace() this replaces).
+_PROMPT_HEAD, _PROMPT_CATALOG_MARK, _PROMPT_TAIL = CONVERSATION_PROMPT.partition("{COMPOSIO_CATALOG}")
+
+
+@lru_cache(maxsize=4)
+def _build_base_prompt(composio_catalog: str) -> str:
+    """Session-independent prompt prefix: base prompt with catalog + save rule.
+
+    Cached per catalog string — the catalog is built once per worker, so every
+    session in the process reuses the same string object.
+    """
+    if not _PROMPT_CATALOG_MARK:
+        return _PROMPT_HEAD + _MEMORY_SAVE_RULE
+    return "".join((
+        _PROMPT_HEAD,
+        composio_catalog or _NO_CATALOG_TEXT,
+        _PROMPT_TAIL,
+        _MEMORY_SAVE_RULE,
+    ))
+
+
+# Tool name keyword -> announcement type, in precedence order (first hit wins).
+# Messaging tools map to email-like announcements; anything else is "save".
+_TOOL_TYPE_KEYWORDS = (
+    ("email", "email"), ("gmail", "email"), ("send", "email"),
+    ("search", "search"), ("query", "search"), ("find", "search"), ("list", "search"),
+    ("document", "document"), ("file", "document"), ("drive", "document"),
+    ("store", "save"), ("save", "save"), ("add", "save"),
+    ("teams", "email"), ("slack", "email"), ("message", "email"),
+)
+
+
+@lru_cache(maxsize=256)
+def _announcement_tool_type(tool_name: str) -> str:
+    """Classify a tool for its spoken announcement (memoized: tool names repeat)."""
+    tool_lower = tool_name.lower()
+    for keyword, tool_type in _TOOL_TYPE_KEYWORDS:
+        if keyword in tool_lower:
+            return tool_type
+    return "save"
+
+
+# Spoken tool-result announcements (no punctuation for voice). Module-level so
+# sessions share them instead of rebuilding the tables per entrypoint.
+_STANDARD_SUCCESS = (
+    "Done",
+    "All set",
+    "Completed",
+    "Finished",
+)
+
+# Witty announcements (20% chance, contextually matched)
+_WITTY_RESPONSES = {
+    "email": (
+        "Message delivered faster than a carrier pigeon",
+        "Email sent and on its way",
+        "Done that message is flying through the internet",
+    ),
+    "search": (
+        "Found your needle in the digital haystack",
+        "Eureka that is exactly what you were looking for",
+        "Got some results for you",
+    ),
+    "save": (
+        "Locked and loaded in the vault",
+        "Saved and secure in the knowledge base",
+        "Information stored successfully",
+    ),
+    "document": (
+        "Found the document you needed",
+        "Got that file pulled up",
+        "Retrieved the document",
+    ),
+    "error": (
+        "Hit a snag on that one let me try a different approach",
+        "That did not work as expected want to try again",
+        "Ran into an issue there",
+    ),
+}
+# Unknown tool types fall back to the "save" lines — one dict lookup per call
+_WITTY_FALLBACK = _WITTY_RESPONSES["save"]
+
+
+def strip_punctuation(text: str) -> str:
+    """Remove all punctuation from text for voice output."""
+    # Remove common punctuation but keep apostrophes in contractions,
+    # then collapse whitespace runs to single spaces
+    return " ".join(text.translate(_VOICE_PUNCT_TABLE).split())
+
+
+def get_witty_response(tool_type: str) -> str:
+    """Get a contextually relevant witty response."""
+    return random.choice(_WITTY_RESPONSES.get(tool_type, _WITTY_FALLBACK))
+
+
+def format_tool_result_v2(tool_name: str, result: str, status: str) -> str:
+    """Format tool result with 20% wit probability, no punctuation.
+
+    Handles both core tools (sendEmail, searchDrive) and Composio tools
+    (composio:batch:TEAMS_SEND+DRIVE_LIST). For Composio tools, the result
+    string already contains voice-friendly text from _extract_voice_result.
+    """
+
+    # Determine tool type for contextual responses
+    tool_type = "error" if status == "failed" else _announcement_tool_type(tool_name)
+
+    # For Composio tools, the result already has voice-friendly text
+    # from _extract_voice_result — use it directly if substantive
+    is_composio = tool_name.startswith("composio:")
+    if is_composio and result and len(result) > 10 and status != "failed":
+        clean_result = strip_punctuation(result[:150])
+        return clean_result
+
+    # 20% chance for witty response
+    use_wit = random.random() < 0.20
+
+    if use_wit:
+        announcement = get_witty_response(tool_type)
+    else:
+        # Standard announcement based on tool type
+        if status == "failed":
+            announcement = "That did not work want to try again"
+        elif tool_type == "email":
+            announcement = "Sent"
+        elif tool_type == "search":
+            # Include summary of what was found
+            if result and len(result) > 10:
+                clean_result = strip_punctuation(result[:120])
+                announcement = f"Here is what I found {clean_result}"
+            else:
+                announcement = "Search complete"
+        elif tool_type == "document":
+            announcement = "Got the document"
+        else:
+            announcement = random.choice(_STANDARD_SUCCESS)
+
+    # Ensure no punctuation in final output
+    return strip_punctuation(announcement)
+
+
+# Prompt clock block. The text only changes once a minute, so sessions joining
+# in the same minute share one formatted string (entrypoint calls this on the
+# event loop only — no lock needed).
+_EST = timezone(timedelta(hours=-5))
+_time_ctx_cache: tuple[int, str] = (-1, "")
+
+
+def _current_time_context() -> str:
+    """Date/time block for the system prompt, rebuilt at most once per minute."""
+    global _time_ctx_cache
+    now = datetime.now(_EST)
+    minute = int(now.timestamp()) // 60
+    if _time_ctx_cache[0] != minute:
+        _time_ctx_cache = (minute, (
+            f"\n\nCURRENT DATE AND TIME\n"
+            f"{now.strftime('%Y-%m-%d %I:%M %p')} EST\n"
+            f"{now.strftime('%A, %B %d, %Y')}\n"
+            f"Always reference EST when discussing time"
+        ))
+    return _time_ctx_cache[1]
+
+
 def _inject_per_turn_context(turn_ctx, new_message, session_id: str, user_mem_dir: str) -> None:
     """Inject compact per-turn context into the LLM call — survives chat_ctx trimming.
 
@@ -273,29 +545,41 @@ async def _immediate_flush_critical_facts(session_id: str, user_id: str, postgre
         logger.debug(f"[FactFlush] Immediate flush failed (non-critical): {_e}")
 
 
-def prewarm(proc: JobProcess):
-    """Prewarm VAD model and initialize cache during server initialization."""
-    logger.info("Prewarming VAD model...")
-    proc.userdata["vad"] = silero.VAD.load(
-        min_speech_duration=0.05,      # 50ms - faster speech detection start
-        min_silence_duration=0.35,     # 350ms - OPTIMIZED from 550ms (saves ~200ms latency)
-        prefix_padding_duration=0.25,  # 250ms - OPTIMIZED from 500ms (saves ~250ms latency)
-        activation_threshold=0.1,      # OPTIMIZED from 0.05 (fewer false positives)
-        sample_rate=16000,             # Silero requires 8kHz or 16kHz
-        force_cpu=True,                # Consistent CPU inference
-    )
-    logger.info("VAD model prewarmed with optimized settings (silence=350ms, threshold=0.1)")
+async def _warm_llm_client(llm_instance) -> None:
+    """Open the conversation LLM's pooled connection before the first turn needs it.
+
+    The plugin's openai.AsyncClient pools connections per event loop, so this
+    runs in the job's loop (a prewarm-time request would warm a dead pool).
+    GET /models costs no tokens; the TCP+TLS handshake it pays is reused by
+    the first chat completion. Failure is non-critical.
 
-    # Initialize context cache manager
-    cache_manager = get_cache_manager()
-    proc.userdata["cache_manager"] = cache_manager
-    logger.info("Context cache manager initialized")
+    The pool lives on the plugin's private _client, so the warm-up must reach it
+    there (a request through any other client would warm a different pool). It is
+    looked up defensively: if a plugin upgrade renames it, warm-up is skipped
+    with a debug log instead of raising.
+    """
+    client = getattr(llm_instance, "_client", None)
+    if client is None or not hasattr(client, "with_options"):
+        logger.debug("LLM warm-up skipped: plugin has no usable _client (%s)", type(llm_instance).__name__)
+        return
+    try:
+        await client.with_options(timeout=5.0, max_retries=0).models.list()
+        logger.debug("LLM connection warmed")
+    except Exception as _e:
+        logger.debug("LLM connection warm-up failed (non-critical): %s", _e)
 
+
+def prewarm(proc: JobProcess):
+    """Prewarm VAD model and initialize cache during server initialization."""
     # Pre-build Composio tool catalog in background thread (non-blocking).
     # Worker registration proceeds immediately. If catalog finishes before
     # first meeting, it gets injected into system prompt. If not, the lazy
     # build on first composioBatchExecute call handles it.
+    # The build stays in this process (it fills composio_router's module-level
+    # slug index); completion is signalled through a Future that entrypoint can
+    # await without joining the thread.
     proc.userdata["composio_catalog"] = ""  # default empty
+    catalog_future: Future = Future()
 
     def _build_catalog():
         try:
@@ -303,25 +587,54 @@ def prewarm(proc: JobProcess):
             proc.userdata["composio_catalog"] = prewarm_slug_index()
         except Exception as e:
             logger.warning(f"Composio catalog prewarm failed: {e}")
+        finally:
+            catalog_future.set_result(proc.userdata["composio_catalog"])
 
     catalog_thread = threading.Thread(target=_build_catalog, daemon=True, name="composio-prewarm")
     catalog_thread.start()
-    proc.userdata["_composio_thread"] = catalog_thread
+    proc.userdata["_composio_catalog_future"] = catalog_future
     logger.info("Composio catalog build started in background thread")
 
-    # Pre-initialize memory store embedding model (non-blocking — failure is tolerated).
-    # Per-user reinit happens in entrypoint(); prewarm only loads the embedding model.
-    if _MEM_AVAILABLE and _mem_store is not None:
+    # Pre-initialize memory store (non-blocking — failure is tolerated).
+    # Per-user reinit happens in entrypoint(); prewarm only sets up the default store.
+    def _init_memory_store():
         try:
             _mem_store.init()
         except Exception as _e:
             logger.warning("[Memory] Store prewarm failed (non-critical): %s", _e)
 
+    # VAD load (model file I/O + ONNX session init), the memory store's disk
+    # setup and the turn detector import are independent — run them side by side
+    # instead of back to back. The turn detector import stays on this (main)
+    # thread: plugin registration raises when done from a worker thread.
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="prewarm") as pool:
+        logger.info("Prewarming VAD model...")
+        vad_future = pool.submit(
+            silero.VAD.load,
+            min_speech_duration=0.05,      # 50ms - faster speech detection start
+            min_silence_duration=0.35,     # 350ms - OPTIMIZED from 550ms (saves ~200ms latency)
+            prefix_padding_duration=0.25,  # 250ms - OPTIMIZED from 500ms (saves ~250ms latency)
+            activation_threshold=0.1,      # OPTIMIZED from 0.05 (fewer false positives)
+            sample_rate=16000,             # Silero requires 8kHz or 16kHz
+            force_cpu=True,                # Consistent CPU inference
+        )
+        if _MEM_AVAILABLE and _mem_store is not None:
+            pool.submit(_init_memory_store)
+        # Turn detector plugin import runs here so the first job doesn't pay it
+        preload_turn_detector()
+
+        # Initialize context cache manager
+        cache_manager = get_cache_manager()
+        proc.userdata["cache_manager"] = cache_manager
+        logger.info("Context cache manager initialized")
+
+        proc.userdata["vad"] = vad_future.result()
+        logger.info("VAD model prewarmed with optimized settings (silence=350ms, threshold=0.1)")
+
     # pgvector startup connectivity test — runs at worker boot, not per-session
     if _PGVECTOR_AVAILABLE:
         _pv_url = getattr(settings, 'pgvector_url', None)
         if _pv_url:
-            import threading as _threading
             def _pgvector_startup():
                 import asyncio as _asyncio
                 _loop = _asyncio.new_event_loop()
@@ -348,7 +661,7 @@ def prewarm(proc: JobProcess):
                     logger.warning(f"pgvector: startup test FAILED: {_e}")
                 finally:
                     _loop.close()
-            _t = _threading.Thread(target=_pgvector_startup, daemon=True)
+            _t = threading.Thread(target=_pgvector_startup, daemon=True)
             _t.start()
             _t.join(timeout=7)  # Short join — 1s margin before LiveKit IPC hard limit (8s); backfill continues as daemon
 
@@ -361,6 +674,20 @@ async def entrypoint(ctx: JobContext):
     logger.info(f"Agent starting for room: {ctx.room.name}")
     tracker = LatencyTracker()
 
+    # Pooled HTTP clients are shared per event loop; close them when the job shuts
+    # down so their connectors don't leak (next job on this loop reopens lazily)
+    ctx.add_shutdown_callback(close_n8n_session)
+    ctx.add_shutdown_callback(close_http_client)
+
+    # Pre-warm context cache: fetches session context before user speaks. It
+    # needs only the room name (known from the dispatch, before connecting), so
+    # the webhook round-trip overlaps memory setup, model init and ctx.connect().
+    # The entry outlives the client wait (up to _CLIENT_WAIT_S) plus the usual
+    # 5-minute window, so a slow client doesn't find it already expired.
+    cache_warm_task = asyncio.create_task(
+        warm_session_cache(ctx.job.room.name or "livekit-agent", ttl=_CLIENT_WAIT_S + 300.0)
+    )
+
     # ── Per-user memory routing ──────────────────────────────────────────────
     # Resolve user identity from room context so all memory (SQLite + markdown)
     # is stored in /app/data/memory/users/{user_id}/ — never shared across users.
@@ -513,10 +840,23 @@ async def entrypoint(ctx: JobContext):
             sample_rate=24000,
         )
 
-    stt, llm_instance, tts = await asyncio.gather(
+    def load_memory_context() -> str:
+        """Read this user's SOUL/MEMORY/USER.md for the prompt (file I/O, off-loop)."""
+        if not (_MEM_AVAILABLE and _session_writer is not None):
+            return ""
+        try:
+            return _session_writer.load_memory_context(_user_mem_dir, max_tokens=500)
+        except Exception as _e:
+            logger.warning("[Memory] Context load failed: %s", _e)
+            return ""
+
+    # The memory-file read rides along with the model constructors, so its disk
+    # I/O overlaps them instead of blocking the loop later during prompt build
+    stt, llm_instance, tts, _memory_context = await asyncio.gather(
         asyncio.to_thread(init_stt),
         asyncio.to_thread(init_llm),
         asyncio.to_thread(init_tts),
+        asyncio.to_thread(load_memory_context),
     )
     logger.info("STT/LLM/TTS initialized in parallel")
 
@@ -580,18 +920,17 @@ async def entrypoint(ctx: JobContext):
     # =========================================================================
     # VAD DEBUG: Monitor if VAD is receiving audio frames
     # =========================================================================
-    vad_frame_count = {"count": 0, "speech_frames": 0, "last_log_time": 0}
+    # Frame counter: next() on itertools.count is one C call per frame
+    vad_frame_count = itertools.count(1)
 
     @session.on("audio_input")
     def on_audio_input(ev):
         """Debug: Monitor raw audio input frames to VAD."""
-        vad_frame_count["count"] += 1
-        # Log every 100 frames (~5 seconds at 50ms frame size)
-        import time
-        now = time.time()
-        if now - vad_frame_count["last_log_time"] > 5.0:
-            vad_frame_count["last_log_time"] = now
-            logger.info(f"🎤 VAD receiving audio: {vad_frame_count['count']} frames total")
+        count = next(vad_frame_count)
+        # Log every 100 frames (~5 seconds at 50ms frame size) — the frame
+        # counter is the throttle, no clock read per frame
+        if count % 100 == 1:
+            logger.info("🎤 VAD receiving audio: %d frames total", count)
 
     # Set global room reference for tool event publishing
     from .utils.room_publisher import set_room as _set_room, publish_error as _publish_error
@@ -611,10 +950,14 @@ async def entrypoint(ctx: JobContext):
     all_tools = list(ASYNC_TOOLS)
 
     # Read pre-built Composio catalog from prewarm (zero latency — no network calls here)
-    # If background thread is still running, proceed without catalog (lazy build handles it)
-    composio_thread = ctx.proc.userdata.get("_composio_thread")
-    if composio_thread and composio_thread.is_alive():
-        logger.info("Composio catalog still building in background, proceeding without")
+    # If the background build is still running, give it a short grace period (awaited
+    # on the loop, no thread parked on a join); past that, proceed without catalog
+    # (lazy build handles it)
+    catalog_future = ctx.proc.userdata.get("_composio_catalog_future")
+    if catalog_future is not None and not catalog_future.done():
+        await asyncio.wait((asyncio.wrap_future(catalog_future),), timeout=_CATALOG_WAIT_S)
+        if not catalog_future.done():
+            logger.info("Composio catalog still building in background, proceeding without")
     composio_catalog = ctx.proc.userdata.get("composio_catalog", "")
     if settings.composio_api_key:
         logger.info(f"Composio: SDK enabled, catalog {'ready' if composio_catalog else 'empty'} ({len(all_tools)} tools)")
@@ -623,53 +966,17 @@ async def entrypoint(ctx: JobContext):
 
     logger.info(f"Agent tools: {len(all_tools)} total")
 
-    # Inject pre-loaded catalog into system prompt via {COMPOSIO_CATALOG} marker
-    active_prompt = CONVERSATION_PROMPT
-    if composio_catalog:
-        active_prompt = active_prompt.replace(
-            "{COMPOSIO_CATALOG}",
-            composio_catalog,
-        )
-    else:
-        active_prompt = active_prompt.replace(
-            "{COMPOSIO_CATALOG}",
-            "No connected services catalog available. Use manageConnections with action status to check what is connected.",
-        )
+    # Prompt order: stable text first (base prompt + catalog + save rule), then the
+    # per-session parts (clock, memory, onboarding). Every session then sends an
+    # identical leading prefix, which the provider's prompt cache can reuse.
+    prompt_parts = [_build_base_prompt(composio_catalog)]
 
     # Inject current date/time context (no tool call needed)
-    from datetime import datetime, timezone, timedelta
-    est = timezone(timedelta(hours=-5))
-    now = datetime.now(est)
-    time_context = (
-        f"\n\nCURRENT DATE AND TIME\n"
-        f"{now.strftime('%Y-%m-%d %I:%M %p')} EST\n"
-        f"{now.strftime('%A, %B %d, %Y')}\n"
-        f"Always reference EST when discussing time"
-    )
-    active_prompt += time_context
-
-    # MEMORY SAVE ENFORCEMENT — injected before memory context so it applies globally
-    _save_enforcement = (
-        "\n\n## MEMORY SAVE RULE (NON-NEGOTIABLE)\n"
-        "NEVER say 'saved', 'stored', 'noted', 'I'll remember that', or any save confirmation "
-        "UNTIL you have received a successful response from deepStore, updateUserProfile, or addContact. "
-        "The sequence is always: call tool → receive success response → then confirm to user. "
-        "If the user says 'remember X', 'save X', 'my favorite X is Y', 'note that' — "
-        "call deepStore immediately with the content and a descriptive label. "
-        "Do not ask permission. Do not delay. Call deepStore first, then confirm."
-    )
-    active_prompt += _save_enforcement
-
-    # Load cross-session memory context for this user and inject into instructions
-    _memory_context = ""
-    if _MEM_AVAILABLE and _session_writer is not None:
-        try:
-            _memory_context = _session_writer.load_memory_context(_user_mem_dir, max_tokens=500)
-        except Exception as _e:
-            logger.warning("[Memory] Context load failed: %s", _e)
+    prompt_parts.append(_current_time_context())
 
+    # Inject the cross-session memory context (loaded alongside STT/LLM/TTS init)
     if _memory_context:
-        active_prompt = active_prompt + "\n\n## Cross-Session Memory\n" + _memory_context
+        prompt_parts.append("\n\n## Cross-Session Memory\n" + _memory_context)
         # Instruct agent to reference session list at greeting
         _session_list_instruction = (
             "\n\nWhen you see 'Recent Sessions' in the context above: "
@@ -677,7 +984,7 @@ async def entrypoint(ctx: JobContext):
             "(e.g., 'I can see we worked on X and Y this week') "
             "and offer to recall full details from any session if needed."
         )
-        active_prompt = active_prompt + _session_list_instruction
+        prompt_parts.append(_session_list_instruction)
 
     if _is_new_user:
         _name_hint = (
@@ -705,7 +1012,9 @@ async def entrypoint(ctx: JobContext):
             "Keep this natural and brief — one exchange at a time, never like a form. "
             "If they decline to be remembered, respect that and move on immediately."
         )
-        active_prompt = active_prompt + _new_user_section
+        prompt_parts.append(_new_user_section)
+
+    active_prompt = "".join(prompt_parts)
 
     # Define agent with all tools (no MCP servers)
     agent = Agent(
@@ -737,37 +1046,76 @@ async def entrypoint(ctx: JobContext):
         try:
             if ctx.room.local_participant:
                 await ctx.room.local_participant.publish_data(data)
-                # Log successful publish at INFO level for debugging
-                logger.info(f"📤 Published {log_type}: {data[:100].decode('utf-8', errors='ignore')}...")
+                # Log successful publish at INFO level for debugging; the preview
+                # decode only happens when INFO is actually emitted
+                if logger.is_enabled_for(logging.INFO):
+                    logger.info("📤 Published %s: %s...", log_type, data[:100].decode("utf-8", errors="ignore"))
                 return True
             else:
-                logger.warning(f"Cannot publish {log_type}: no local_participant")
+                logger.warning("Cannot publish %s: no local_participant", log_type)
         except Exception as e:
-            logger.warning(f"Failed to publish {log_type}: {e}")
+            logger.warning("Failed to publish %s: %s", log_type, e)
         return False
 
+    # One long-lived publisher drains data-channel frames in order. Event handlers
+    # only enqueue — no Task per frame, and rapid state flips can't reorder.
+    # Once the buffer holds _PUBLISH_BACKLOG_MAX frames (e.g. while the room is
+    # reconnecting) the oldest agent.state frame that a newer state frame (queued
+    # or incoming) supersedes is dropped to make room. The newest state and all
+    # other frames (transcripts) are never dropped, so the cap is soft: with no
+    # superseded state frame left to shed, the buffer grows past it.
+    _publish_buf: deque = deque()
+    _publish_ready = asyncio.Event()
+    # Last agent.state frame queued; a repeat of it is never enqueued. Cleared
+    # on a failed publish so the next emit of that state is retried.
+    last_state = {"value": None}
+
+    def publish_frame(data: bytes, log_type: str = "data") -> None:
+        """Queue a frame for the session publisher (safe from sync callbacks)."""
+        if len(_publish_buf) >= _PUBLISH_BACKLOG_MAX:
+            state_idx = [i for i, (_, queued_type) in enumerate(_publish_buf) if queued_type == "agent.state"]
+            if log_type != "agent.state":
+                state_idx = state_idx[:-1]  # the newest queued state is still current
+            if state_idx:
+                del _publish_buf[state_idx[0]]
+        _publish_buf.append((data, log_type))
+        _publish_ready.set()
+
+    def publish_state(frame: bytes) -> None:
+        """Queue an agent.state frame unless it repeats the last one queued."""
+        if last_state["value"] is frame:
+            return
+        last_state["value"] = frame
+        publish_frame(frame, log_type="agent.state")
+
+    async def _frame_publisher():
+        while True:
+            await _publish_ready.wait()
+            while _publish_buf:
+                data, log_type = _publish_buf.popleft()
+                if not await safe_publish_data(data, log_type=log_type) and log_type == "agent.state":
+                    last_state["value"] = None
+            _publish_ready.clear()
+
+    asyncio.create_task(_frame_publisher())
+
     @session.on("user_state_changed")
     def on_user_state_changed(ev):
         """User state: speaking, listening, away."""
-        state = ev.new_state if hasattr(ev, 'new_state') else str(ev)
+        state = ev.new_state
         logger.debug(f"User state changed: {state}")
         if str(state) == "speaking":
             tracker.start("total_latency")
-            asyncio.create_task(safe_publish_data(
-                b'{"type":"agent.state","state":"listening"}',
-                log_type="agent.state"
-            ))
+            publish_state(_STATE_LISTENING)
 
     @session.on("user_input_transcribed")
     def on_user_input_transcribed(ev):
         """Called when user speech is transcribed."""
-        text = ev.transcript if hasattr(ev, 'transcript') else str(ev)
-        is_final = getattr(ev, 'is_final', True)
-
         # ONLY publish FINAL transcripts to avoid duplicates
         # Interim results are partial and will be superseded
-        if not is_final:
+        if not ev.is_final:
             return
+        text = ev.transcript
 
         # Safe text handling for logging
         text_preview = text[:100] if text and len(text) > 100 else (text or "(empty)")
@@ -780,14 +1128,10 @@ async def entrypoint(ctx: JobContext):
             asyncio.create_task(_pg_logger.log_turn(session_id, "user", text, user_id=_user_id))
 
         # Publish user transcript to client for UI display
-        asyncio.create_task(safe_publish_data(
-            json.dumps({
-                "type": "transcript.user",
-                "text": text or "",
-                "is_final": True
-            }).encode(),
+        publish_frame(
+            _TRANSCRIPT_USER_HEAD + _json_str_bytes(text or "") + b"}",
             log_type="transcript.user"
-        ))
+        )
 
         # Wake word gate: suppress agent response if no wake word detected
         # and no active task objective is currently being executed
@@ -800,7 +1144,7 @@ async def entrypoint(ctx: JobContext):
             and not getattr(_task_tracker, '_objective_completed', True)
         )
         # Grace period: bypass gate within 2.5s of agent finishing speaking
-        _secs_since_listened = time.time() - _last_agent_listening_time
+        _secs_since_listened = time.monotonic() - _last_agent_listening_time
         _in_grace_period = (
             _last_agent_listening_time > 0
             and _secs_since_listened < _WAKE_GATE_GRACE_PERIOD_SECS
@@ -864,11 +1208,11 @@ async def entrypoint(ctx: JobContext):
     @session.on("agent_state_changed")
     def on_agent_state_changed(ev):
         """Agent state: initializing, idle, listening, thinking, speaking."""
-        state = ev.new_state if hasattr(ev, 'new_state') else str(ev)
+        state = ev.new_state
         logger.debug(f"Agent state changed: {state}")
 
-        state_str = str(state).lower()
-        if "thinking" in state_str:
+        name = state if state in _STATE_FRAMES else _agent_state_name(state)
+        if name == "thinking":
             # Wake word gate: reset suppress flag if it was set (interrupt already fired at
             # transcription time in on_user_input_transcribed — no second interrupt needed here)
             global _wake_gate_suppress
@@ -878,24 +1222,15 @@ async def entrypoint(ctx: JobContext):
                 _task_tracker.record_agent_responding()  # Fix 2A: task tracker must see LLM inference even when gate suppressed
                 return  # Skip remaining state handling
             _task_tracker.record_agent_responding()
-            asyncio.create_task(safe_publish_data(
-                b'{"type":"agent.state","state":"thinking"}',
-                log_type="agent.state"
-            ))
-        elif "speaking" in state_str:
-            asyncio.create_task(safe_publish_data(
-                b'{"type":"agent.state","state":"speaking"}',
-                log_type="agent.state"
-            ))
-        elif "listening" in state_str:
+            publish_state(_STATE_THINKING)
+        elif name == "speaking":
+            publish_state(_STATE_SPEAKING)
+        elif name == "listening":
             global _last_agent_listening_time
-            _last_agent_listening_time = time.time()
+            _last_agent_listening_time = time.monotonic()
             _task_tracker.record_agent_idle()
-            asyncio.create_task(safe_publish_data(
-                b'{"type":"agent.state","state":"listening"}',
-                log_type="agent.state"
-            ))
-        elif "idle" in state_str:
+            publish_state(_STATE_LISTENING)
+        elif name == "idle":
             # Fix 2B: do NOT update _last_agent_listening_time here — idle fires on every
             # tool execution pause, which resets the 30s grace period clock prematurely.
             # Grace period clock is only reset when the agent enters "listening" (post-speech).
@@ -903,10 +1238,7 @@ async def entrypoint(ctx: JobContext):
             total = tracker.end("total_latency")
             if total:
                 logger.info(f"Total latency: {total:.0f}ms")
-            asyncio.create_task(safe_publish_data(
-                b'{"type":"agent.state","state":"idle"}',
-                log_type="agent.state"
-            ))
+            publish_state(_STATE_IDLE)
 
     @session.on("conversation_item_added")
     def on_conversation_item_added(ev):
@@ -916,21 +1248,15 @@ async def entrypoint(ctx: JobContext):
         if not item:
             return
 
-        # Check if this is an assistant (agent) message
+        # ChatMessage (1.3.x) exposes role and text_content (joined str parts, or
+        # None); other chat items (function calls/outputs) carry neither.
         role = getattr(item, 'role', None)
+        text = getattr(item, 'text_content', None) or ""
 
         # Auto-capture memory triggers from user utterances
-        if _MEM_AVAILABLE and _mem_capture is not None:
+        if _MEM_AVAILABLE and _mem_capture is not None and role == 'user' and text:
             try:
-                # Only capture from user messages, not agent responses
-                if hasattr(item, 'role') and str(getattr(item, 'role', '')).lower() == 'user':
-                    _text = ""
-                    if hasattr(item, 'text_content'):
-                        _text = item.text_content or ""
-                    elif hasattr(item, 'content') and isinstance(item.content, str):
-                        _text = item.content
-                    if _text:
-                        _mem_capture.detect_and_queue(_text)
+                _mem_capture.detect_and_queue(text)
             except Exception as _e:
                 logger.debug("[Memory] Capture check failed: %s", _e)
 
@@ -943,32 +1269,13 @@ async def entrypoint(ctx: JobContext):
             logger.debug("[WakeGate] Blocking suppressed assistant message from chat publication")
             return
 
-        # Extract text content from the item
-        text = ""
-        try:
-            # Try text_content attribute (common in conversation items)
-            if hasattr(item, 'text_content'):
-                text = item.text_content or ""
-            # Try content attribute
-            elif hasattr(item, 'content'):
-                content = item.content
-                if isinstance(content, str):
-                    text = content
-                elif hasattr(content, 'text'):
-                    text = content.text or ""
-            # Try text attribute directly
-            elif hasattr(item, 'text'):
-                text = item.text or ""
-        except Exception as e:
-            logger.debug(f"Could not extract conversation item text: {e}")
-
         if text:
             text_preview = text[:100] if len(text) > 100 else text
             logger.info(f"Agent said: {text_preview}")
-            asyncio.create_task(safe_publish_data(
-                json.dumps({"type": "transcript.assistant", "text": text}).encode(),
+            publish_frame(
+                _TRANSCRIPT_ASSISTANT_HEAD + _json_str_bytes(text) + b"}",
                 log_type="transcript.assistant"
-            ))
+            )
             # OpenClaw-style interim-phrase detection: feed agent speech to task
             # tracker so Case 3 stall detection can arm if the LLM says something
             # like "let me try" or "working on it" without calling a tool.
@@ -1119,117 +1426,6 @@ async def entrypoint(ctx: JobContext):
     # - Clean conversational announcements
     # =========================================================================
 
-    import random
-
-    # Standard announcements (no punctuation for voice)
-    STANDARD_SUCCESS = [
-        "Done",
-        "All set",
-        "Completed",
-        "Finished",
-    ]
-
-    # Witty announcements (20% chance, contextually matched)
-    WITTY_RESPONSES = {
-        "email": [
-            "Message delivered faster than a carrier pigeon",
-            "Email sent and on its way",
-            "Done that message is flying through the internet",
-        ],
-        "search": [
-            "Found your needle in the digital haystack",
-            "Eureka that is exactly what you were looking for",
-            "Got some results for you",
-        ],
-        "save": [
-            "Locked and loaded in the vault",
-            "Saved and secure in the knowledge base",
-            "Information stored successfully",
-        ],
-        "document": [
-            "Found the document you needed",
-            "Got that file pulled up",
-            "Retrieved the document",
-        ],
-        "error": [
-            "Hit a snag on that one let me try a different approach",
-            "That did not work as expected want to try again",
-            "Ran into an issue there",
-        ],
-    }
-
-    def strip_punctuation(text: str) -> str:
-        """Remove all punctuation from text for voice output."""
-        import re
-        # Remove common punctuation but keep apostrophes in contractions
-        text = re.sub(r'[.,!?;:\-"\(\)\[\]{}]', '', text)
-        # Clean up extra spaces
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
-
-    def get_witty_response(tool_type: str) -> str:
-        """Get a contextually relevant witty response."""
-        responses = WITTY_RESPONSES.get(tool_type, WITTY_RESPONSES.get("save", []))
-        return random.choice(responses) if responses else "Done"
-
-    def format_tool_result_v2(tool_name: str, result: str, status: str) -> str:
-        """Format tool result with 20% wit probability, no punctuation.
-
-        Handles both core tools (sendEmail, searchDrive) and Composio tools
-        (composio:batch:TEAMS_SEND+DRIVE_LIST). For Composio tools, the result
-        string already contains voice-friendly text from _extract_voice_result.
-        """
-
-        # Determine tool type for contextual responses
-        tool_lower = tool_name.lower()
-        tool_type = "save"  # default
-        if "email" in tool_lower or "gmail" in tool_lower or "send" in tool_lower:
-            tool_type = "email"
-        elif "search" in tool_lower or "query" in tool_lower or "find" in tool_lower or "list" in tool_lower:
-            tool_type = "search"
-        elif "document" in tool_lower or "file" in tool_lower or "drive" in tool_lower:
-            tool_type = "document"
-        elif "store" in tool_lower or "save" in tool_lower or "add" in tool_lower:
-            tool_type = "save"
-        elif "teams" in tool_lower or "slack" in tool_lower or "message" in tool_lower:
-            tool_type = "email"  # messaging maps to email-like announcements
-
-        if status == "failed":
-            tool_type = "error"
-
-        # For Composio tools, the result already has voice-friendly text
-        # from _extract_voice_result — use it directly if substantive
-        is_composio = tool_name.startswith("composio:")
-        if is_composio and result and len(result) > 10 and status != "failed":
-            clean_result = strip_punctuation(result[:150])
-            return clean_result
-
-        # 20% chance for witty response
-        use_wit = random.random() < 0.20
-
-        if use_wit:
-            announcement = get_witty_response(tool_type)
-        else:
-            # Standard announcement based on tool type
-            if status == "failed":
-                announcement = "That did not work want to try again"
-            elif tool_type == "email":
-                announcement = "Sent"
-            elif tool_type == "search":
-                # Include summary of what was found
-                if result and len(result) > 10:
-                    clean_result = strip_punctuation(result[:120])
-                    announcement = f"Here is what I found {clean_result}"
-                else:
-                    announcement = "Search complete"
-            elif tool_type == "document":
-                announcement = "Got the document"
-            else:
-                announcement = random.choice(STANDARD_SUCCESS)
-
-        # Ensure no punctuation in final output
-        return strip_punctuation(announcement)
-
     async def handle_tool_result(result_data: dict):
         """Handle async tool result with AIO v2 conversational announcement."""
         tool_name = result_data.get("tool_name", "unknown")
@@ -1275,7 +1471,7 @@ async def entrypoint(ctx: JobContext):
     def on_data_received(data: rtc.DataPacket):
         """Handle incoming data packets from OTHER participants."""
         try:
-            message = json.loads(data.data.decode("utf-8"))
+            message = _json_loads(data.data)
             msg_type = message.get("type", "")
 
             if msg_type == "tool_result":
@@ -1307,69 +1503,82 @@ async def entrypoint(ctx: JobContext):
             # CRITICAL DIAGNOSTIC: Count actual audio frames from this track
             async def count_audio_frames():
                 """Count audio frames to verify audio is flowing."""
-                import struct
-                import math
 
                 frame_count = 0
                 silent_frames = 0
-                max_rms = 0.0
-                rms_sum = 0.0
-                last_log_time = asyncio.get_event_loop().time()
+                # Integer accumulators — sqrt/log10 run only when stats are logged
+                total_sum_sq = 0
+                total_samples = 0
+                max_mean_sq = 0.0
+                loop = asyncio.get_running_loop()
+                last_log_time = loop.time()
 
                 try:
-                    audio_stream = rtc.AudioStream(track)
+                    # Bounded: this diagnostic is a second consumer of the mic track. If
+                    # it falls behind, the ring buffer drops the oldest frames instead
+                    # of queueing audio without limit. 50 ms frames match the agent's
+                    # own room_io input framing; the SDK default (native 10 ms) would
+                    # wake this loop 5x as often for the same audio.
+                    audio_stream = rtc.AudioStream(track, capacity=64, frame_size_ms=50)
                     async for frame_event in audio_stream:
                         frame_count += 1
                         frame = frame_event.frame
 
-                        # Check if frame is silent (all zeros or very low)
+                        # Accumulate energy; silence check is on the mean square
+                        # (rms < 100 ⇔ mean_sq < 100², very quiet, below -50dB)
                         samples = frame.data
-                        rms = 0.0
                         if samples:
-                            # Calculate RMS of frame
                             try:
-                                # Assuming 16-bit PCM
-                                num_samples = len(samples) // 2
-                                if num_samples > 0:
-                                    values = struct.unpack(f'{num_samples}h', samples[:num_samples*2])
-                                    rms = (sum(v*v for v in values) / num_samples) ** 0.5
-                                    rms_sum += rms
-                                    if rms > max_rms:
-                                        max_rms = rms
-                                    if rms < 100:  # Very quiet (below -50dB)
+                                # 16-bit PCM — one vectorized reduction per frame over
+                                # every 4th sample (within ~0.5 dB of full RMS on speech;
+                                # totals below count only the samples actually used)
+                                pcm = np.frombuffer(samples, dtype=np.int16)[::_RMS_SAMPLE_STRIDE]
+                                n = pcm.size
+                                if n > 0:
+                                    sum_sq = int(np.square(pcm, dtype=np.int64).sum())
+                                    total_sum_sq += sum_sq
+                                    total_samples += n
+                                    mean_sq = sum_sq / n
+                                    if mean_sq > max_mean_sq:
+                                        max_mean_sq = mean_sq
+                                    if mean_sq < 10_000:
                                         silent_frames += 1
                             except Exception:  # nosec B110 - audio frame RMS calc is best-effort
                                 pass
 
                         # Log every 5 seconds
-                        now = asyncio.get_event_loop().time()
+                        now = loop.time()
                         if now - last_log_time > 5.0:
                             last_log_time = now
                             pct_silent = (silent_frames / frame_count * 100) if frame_count > 0 else 0
-                            avg_rms = rms_sum / frame_count if frame_count > 0 else 0
 
-                            # Convert to dB for meaningful interpretation
-                            # 32767 is max for 16-bit audio, so dB = 20*log10(rms/32767)
-                            max_db = 20 * math.log10(max_rms / 32767) if max_rms > 0 else -100
-                            avg_db = 20 * math.log10(avg_rms / 32767) if avg_rms > 0 else -100
+                            # dB math only when the INFO stats lines will actually be emitted
+                            if logger.is_enabled_for(logging.INFO):
+                                avg_rms = math.sqrt(total_sum_sq / total_samples) if total_samples > 0 else 0
+                                max_rms = math.sqrt(max_mean_sq)
+                                max_db = _to_dbfs(max_rms)
+                                avg_db = _to_dbfs(avg_rms)
 
-                            logger.info(f"📊 AUDIO FRAME STATS: {frame_count} total, {silent_frames} silent ({pct_silent:.1f}%)")
-                            logger.info(f"   Sample rate: {frame.sample_rate}, Channels: {frame.num_channels}")
-                            logger.info(f"   RMS: avg={avg_rms:.1f} ({avg_db:.1f}dB), max={max_rms:.1f} ({max_db:.1f}dB)")
+                                logger.info("📊 AUDIO FRAME STATS: %d total, %d silent (%.1f%%)", frame_count, silent_frames, pct_silent)
+                                logger.info("   Sample rate: %d, Channels: %d", frame.sample_rate, frame.num_channels)
+                                logger.info("   RMS: avg=%.1f (%.1fdB), max=%.1f (%.1fdB)", avg_rms, avg_db, max_rms, max_db)
 
                             # VAD threshold 0.05 with Silero typically requires > -40dB audio
-                            if max_db < -50:
-                                logger.warning(f"⚠️ AUDIO VERY QUIET (max {max_db:.1f}dB) - VAD may not trigger!")
+                            if max_mean_sq < _QUIET_MEAN_SQ:
+                                max_db = _to_dbfs(math.sqrt(max_mean_sq))
+                                logger.warning("⚠️ AUDIO VERY QUIET (max %.1fdB) - VAD may not trigger!", max_db)
                             elif pct_silent > 90:
-                                logger.warning(f"⚠️ AUDIO IS MOSTLY SILENT - Check Recall.ai audio source!")
+                                logger.warning("⚠️ AUDIO IS MOSTLY SILENT - Check Recall.ai audio source!")
                             else:
-                                logger.info(f"   ✅ Audio levels look good for VAD (threshold=0.05)")
+                                logger.info("   ✅ Audio levels look good for VAD (threshold=0.05)")
 
                 except Exception as e:
-                    logger.error(f"Audio frame counting error: {e}")
+                    logger.error("Audio frame counting error: %s", e)
 
-            # Start counting in background
-            asyncio.create_task(count_audio_frames())
+            # Start counting in background — opt-in: the per-frame RMS pass is a
+            # debugging aid, and audio flow is already logged by on_audio_input
+            if settings.debug_audio_rms:
+                asyncio.create_task(count_audio_frames())
 
     @ctx.room.on("track_published")
     def on_track_published(publication, participant):
@@ -1434,7 +1643,9 @@ async def entrypoint(ctx: JobContext):
     # This is CRITICAL - the session must link to the client participant
     # to receive audio from them
     # Timeout is 300s (5 min) - early arrival returns immediately, no delay
-    async def wait_for_client_with_audio(timeout_seconds: float = 300.0) -> Optional[rtc.RemoteParticipant]:
+    async def wait_for_client_with_audio(
+        timeout_seconds: float = 300.0,
+    ) -> tuple[Optional[rtc.RemoteParticipant], Optional[rtc.RemoteTrackPublication]]:
         """Wait for the Output Media webpage client to connect AND publish audio.
 
         CRITICAL: We must wait for the audio track to be published, not just for
@@ -1442,54 +1653,89 @@ async def entrypoint(ctx: JobContext):
         participant that hasn't published audio yet.
 
         Returns immediately when client's audio track is detected - the timeout
-        only applies if client never arrives or never publishes audio.
+        only applies if client never arrives or never publishes audio. The result
+        is (participant, audio publication); the publication is None if the client
+        never published audio, and both are None if no client arrived.
         """
-        start_time = asyncio.get_event_loop().time()
-        check_interval = 0.5  # Check every 500ms for fast response
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
 
         client_participant = None
-        audio_track_found = False
 
-        while (asyncio.get_event_loop().time() - start_time) < timeout_seconds:
-            # Check current participants for the client
-            for participant in ctx.room.remote_participants.values():
-                if participant is None:
-                    continue
-                identity = getattr(participant, 'identity', None)
-                if identity is None:
-                    continue
-                identity_lower = identity.lower()
+        # Re-scan only when the room reports a join or a new track — no polling
+        room_changed = asyncio.Event()
+
+        def _on_room_change(*_args):
+            room_changed.set()
 
-                # Output Media client identity format: 'output-media-{session_id}'
-                if identity_lower.startswith('output-media-'):
+        ctx.room.on("participant_connected", _on_room_change)
+        ctx.room.on("track_published", _on_room_change)
+        try:
+            while True:
+                room_changed.clear()
+                # Check current participants for the client (the SDK never
+                # stores None values and identity is always a str)
+                clients = [
+                    p for p in ctx.room.remote_participants.values()
+                    if _OUTPUT_MEDIA_IDENTITY.match(p.identity)
+                ]
+                for participant in clients:
                     if client_participant is None:
-                        logger.info(f"👤 Client found: {participant.identity}")
+                        logger.info("👤 Client found: %s", participant.identity)
                         client_participant = participant
 
                     # Check if client has published an audio track
                     for pub in participant.track_publications.values():
                         if pub.kind == rtc.TrackKind.KIND_AUDIO:
-                            logger.info(f"🎤 Client audio track found!")
-                            logger.info(f"   - Track SID: {pub.sid}")
-                            logger.info(f"   - Track Name: {pub.name}")
-                            logger.info(f"   - Track Source: {pub.source}")
-                            audio_track_found = True
-                            break
-
-                    if audio_track_found:
-                        return participant
-
-            await asyncio.sleep(check_interval)
+                            logger.info("🎤 Client audio track found!")
+                            logger.info("   - Track SID: %s", pub.sid)
+                            logger.info("   - Track Name: %s", pub.name)
+                            logger.info("   - Track Source: %s", pub.source)
+                            return participant, pub
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(room_changed.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+        finally:
+            ctx.room.off("participant_connected", _on_room_change)
+            ctx.room.off("track_published", _on_room_change)
 
-        if client_participant and not audio_track_found:
+        if client_participant:
             logger.warning(f"Client connected but no audio track published after {timeout_seconds}s")
-            return client_participant  # Return participant anyway, maybe track will come later
+            return client_participant, None  # Return participant anyway, maybe track will come later
 
         logger.warning(f"Timeout waiting for client after {timeout_seconds}s")
-        return None
+        return None, None
+
+    async def _init_session_stores():
+        """Open the Postgres logging pool and pgvector store (both idempotent)."""
+        # Initialize pg_logger pool once per session (idempotent — checks if already initialized)
+        if settings.postgres_url:
+            await _pg_logger.init_pool(settings.postgres_url)
+
+        # Initialize pgvector semantic memory store (once per worker lifetime — idempotent on subsequent sessions)
+        _pgvector_url = getattr(settings, 'pgvector_url', None)
+        if _pgvector_url and _PGVECTOR_AVAILABLE:
+            try:
+                await _pgvector.init_pgvector_pool(_pgvector_url)
+                logger.info("pgvector: semantic memory store ready")
+            except Exception as _pge:
+                logger.warning("pgvector: init failed (SQLite fallback active): %s", _pge)
+
+    # Client-independent setup starts now so it overlaps the client wait and the
+    # Web Audio delay below instead of running serially before session.start().
+    # Open the Fireworks TLS connections now so the first tool delegation and
+    # the first conversational turn both reuse them
+    asyncio.create_task(_warm_fireworks_connection())
+    asyncio.create_task(_warm_llm_client(llm_instance))
+    session_stores_task = asyncio.create_task(_init_session_stores())
 
     logger.info("Waiting for Output Media client to connect AND publish audio (up to 5 min)...")
-    client_participant = await wait_for_client_with_audio(timeout_seconds=300.0)
+    client_participant, audio_pub = await wait_for_client_with_audio(timeout_seconds=_CLIENT_WAIT_S)
 
     if client_participant:
         # Brief delay for Web Audio API initialization (OPTIMIZED from 1.5s to 0.3s)
@@ -1503,39 +1749,47 @@ async def entrypoint(ctx: JobContext):
         # =====================================================================
         logger.info("=== AUDIO SUBSCRIPTION VERIFICATION ===")
 
+        # The waiter hands back the publication it confirmed; only a client that
+        # never published audio before the timeout needs another look here
+        if audio_pub is None:
+            audio_pub = next(
+                (p for p in client_participant.track_publications.values()
+                 if p.kind == rtc.TrackKind.KIND_AUDIO),
+                None,
+            )
+
         audio_track_subscribed = False
-        for pub in client_participant.track_publications.values():
-            if pub.kind == rtc.TrackKind.KIND_AUDIO:
-                logger.info(f"Audio track publication found:")
-                logger.info(f"  - SID: {pub.sid}")
-                logger.info(f"  - Name: {pub.name}")
-                logger.info(f"  - Source: {pub.source}")
-                logger.info(f"  - Is Subscribed: {pub.subscribed}")
-                logger.info(f"  - Is Muted: {pub.muted}")
-
-                if pub.subscribed:
-                    audio_track_subscribed = True
-                    # Get the actual track
-                    track = pub.track
-                    if track:
-                        logger.info(f"  - Track kind: {track.kind}")
-                        logger.info(f"  - Track SID: {track.sid}")
-                        logger.info(f"  ✅ Audio track is subscribed and ready!")
-                    else:
-                        logger.warning(f"  ⚠️ Publication subscribed but track is None!")
+        if audio_pub is not None:
+            logger.info(f"Audio track publication found:")
+            logger.info(f"  - SID: {audio_pub.sid}")
+            logger.info(f"  - Name: {audio_pub.name}")
+            logger.info(f"  - Source: {audio_pub.source}")
+            logger.info(f"  - Is Subscribed: {audio_pub.subscribed}")
+            logger.info(f"  - Is Muted: {audio_pub.muted}")
+
+            if audio_pub.subscribed:
+                audio_track_subscribed = True
+                # Get the actual track
+                track = audio_pub.track
+                if track:
+                    logger.info(f"  - Track kind: {track.kind}")
+                    logger.info(f"  - Track SID: {track.sid}")
+                    logger.info(f"  ✅ Audio track is subscribed and ready!")
                 else:
-                    # CRITICAL: Force subscription if not subscribed
-                    logger.warning(f"  ⚠️ Audio track NOT subscribed! Attempting manual subscription...")
-                    try:
-                        pub.set_subscribed(True)
-                        await asyncio.sleep(0.5)  # Give time for subscription
-                        if pub.subscribed:
-                            logger.info(f"  ✅ Manual subscription successful!")
-                            audio_track_subscribed = True
-                        else:
-                            logger.error(f"  ❌ Manual subscription FAILED!")
-                    except Exception as e:
-                        logger.error(f"  ❌ Manual subscription error: {e}")
+                    logger.warning(f"  ⚠️ Publication subscribed but track is None!")
+            else:
+                # CRITICAL: Force subscription if not subscribed
+                logger.warning(f"  ⚠️ Audio track NOT subscribed! Attempting manual subscription...")
+                try:
+                    audio_pub.set_subscribed(True)
+                    await asyncio.sleep(0.5)  # Give time for subscription
+                    if audio_pub.subscribed:
+                        logger.info(f"  ✅ Manual subscription successful!")
+                        audio_track_subscribed = True
+                    else:
+                        logger.error(f"  ❌ Manual subscription FAILED!")
+                except Exception as e:
+                    logger.error(f"  ❌ Manual subscription error: {e}")
 
         if not audio_track_subscribed:
             logger.warning("⚠️ NO AUDIO TRACK SUBSCRIBED - Agent will not hear client!")
@@ -1563,8 +1817,6 @@ async def entrypoint(ctx: JobContext):
         logger.info(f"  audio_input: sample_rate=16000, num_channels=1")
         logger.info(f"  audio_output: sample_rate=24000, num_channels=1")
 
-        # Pre-warm context cache in background while session starts
-        # This fetches session context before user speaks, reducing first-query latency
         session_id = ctx.room.name or "livekit-agent"
         _session_id_ref[0] = session_id  # Update ref so on_user_turn_completed closure sees it
         set_current_session_id(session_id)
@@ -1572,21 +1824,11 @@ async def entrypoint(ctx: JobContext):
         _register_session(session_id, session)
         if _MEM_AVAILABLE and _mem_capture is not None:
             _mem_capture.set_user_id(_user_id)
-        cache_warm_task = asyncio.create_task(warm_session_cache(session_id))
-        # Initialize pg_logger pool once per session (idempotent — checks if already initialized)
+        # Stores were opened in the background during the client wait
+        await session_stores_task
         if settings.postgres_url:
-            await _pg_logger.init_pool(settings.postgres_url)
             asyncio.create_task(_pg_logger.log_session_start(session_id, _user_id, ctx.room.name))
 
-        # Initialize pgvector semantic memory store (once per worker lifetime — idempotent on subsequent sessions)
-        _pgvector_url = getattr(settings, 'pgvector_url', None)
-        if _pgvector_url and _PGVECTOR_AVAILABLE:
-            try:
-                await _pgvector.init_pgvector_pool(_pgvector_url)
-                logger.info("pgvector: semantic memory store ready")
-            except Exception as _pge:
-                logger.warning("pgvector: init failed (SQLite fallback active): %s", _pge)
-
         await session.start(
             agent=agent,
             room=ctx.room,
@@ -1688,6 +1930,19 @@ async def entrypoint(ctx: JobContext):
     # speaks completion messages when background presentation generation finishes.
     # Stored in a variable to prevent garbage collection; cancelled naturally when the
     # enclosing coroutine (entrypoint) exits and the event loop tears down.
+    def _store_gamma_facts(content_type: str, gamma_url: str, topic: str, generation_id: str) -> None:
+        """Record a finished Gamma result in session facts (per-type and canonical keys)."""
+        _store_fact(session_id, f"gamma_{content_type}_url", gamma_url)
+        _store_fact(session_id, f"gamma_{content_type}_topic", topic)
+        if generation_id:
+            _store_fact(session_id, f"gamma_{content_type}_generation_id", generation_id)
+        # Canonical keys — always overwrite so agent_context_tool
+        # can read the most-recent Gamma result without knowing content_type
+        _store_fact(session_id, "gammaUrl", gamma_url)
+        _store_fact(session_id, "gammaLastTopic", topic)
+        if generation_id:
+            _store_fact(session_id, "gammaGenerationId", generation_id)
+
     async def _gamma_notification_monitor(session_ref):
         """Monitor gamma notification queue and proactively speak results.
 
@@ -1721,22 +1976,10 @@ async def entrypoint(ctx: JobContext):
                         # Store Gamma context in session facts for multi-turn coherence.
                         # Without this, the LLM has no record of gammaUrl across correction
                         # turns and re-generates the full document on every follow-up.
-                        generation_id = notification.get("generation_id", "")
                         if gamma_url:
-                            _store_fact(session_id, f"gamma_{content_type}_url", gamma_url)
-                            _store_fact(session_id, f"gamma_{content_type}_topic", topic)
-                            if generation_id:
-                                _store_fact(
-                                    session_id,
-                                    f"gamma_{content_type}_generation_id",
-                                    generation_id,
-                                )
-                            # Canonical keys — always overwrite so agent_context_tool
-                            # can read the most-recent Gamma result without knowing content_type
-                            _store_fact(session_id, "gammaUrl", gamma_url)
-                            _store_fact(session_id, "gammaLastTopic", topic)
-                            if generation_id:
-                                _store_fact(session_id, "gammaGenerationId", generation_id)
+                            _store_gamma_facts(
+                                content_type, gamma_url, topic, notification.get("generation_id", ""),
+                            )
 
                         # session_facts already stores the URL persistently for follow-up
                         # turns via checkContext/_append_gamma_facts. No chat_ctx injection
@@ -1764,16 +2007,7 @@ async def entrypoint(ctx: JobContext):
                     if gamma_url:
                         logger.info(f"Gamma monitor: silent notification — injecting context job={job_id} url={gamma_url[:60]}")
                         generation_id = notification.get("generation_id", "")
-                        _store_fact(session_id, f"gamma_{content_type}_url", gamma_url)
-                        _store_fact(session_id, f"gamma_{content_type}_topic", topic)
-                        if generation_id:
-                            _store_fact(session_id, f"gamma_{content_type}_generation_id", generation_id)
-                        # Canonical keys — always overwrite so agent_context_tool
-                        # can read the most-recent Gamma result without knowing content_type
-                        _store_fact(session_id, "gammaUrl", gamma_url)
-                        _store_fact(session_id, "gammaLastTopic", topic)
-                        if generation_id:
-                            _store_fact(session_id, "gammaGenerationId", generation_id)
+                        _store_gamma_facts(content_type, gamma_url, topic, generation_id)
                         # Deliver the result via generate_reply so LiveKit produces actual
                         # speech. Injecting a silent assistant message into chat_ctx was
                         # causing LiveKit to consider the turn already answered → agent
@@ -2214,38 +2448,44 @@ async def entrypoint(ctx: JobContext):
     # If we started without a client, wait for one to connect
     if not client_participant:
         logger.info("No client yet - waiting for Output Media client to connect...")
-        # Keep checking for the client while the room is active
-        while True:
-            await asyncio.sleep(5.0)  # Check every 5 seconds
-
-            # Check if room is still active (defensive comparison)
-            try:
-                if ctx.room.connection_state != rtc.ConnectionState.CONN_CONNECTED:
-                    logger.info("Room disconnected, exiting")
-                    break
-            except Exception as e:
-                logger.error(f"Error checking connection state: {e}")
-                break
-
-            # Look for client participant with defensive null checks
-            client_found = False
-            for participant in ctx.room.remote_participants.values():
-                if participant is None:
-                    continue
-                identity = getattr(participant, 'identity', None)
-                if identity is None:
-                    continue
-                if identity.lower().startswith('output-media-'):
-                    logger.info(f"Client connected late: {identity}")
-                    # Client finally connected - but we can't re-link the session
-                    # The session was already started without a participant
-                    # Audio from client won't be received, but at least agent stays alive
-                    client_found = True
-                    break
-
-            if client_found:
-                break
-            # No client yet, keep waiting
+        # Resolves with the late client, or None once the room disconnects
+        # (CONN_RECONNECTING is transient and keeps waiting).
+        # Join events wake this exactly once — no periodic re-scan of participants.
+        late_client: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        def _on_late_join(participant) -> None:
+            if not late_client.done() and _OUTPUT_MEDIA_IDENTITY.match(participant.identity):
+                late_client.set_result(participant)
+
+        def _on_room_gone(*_args) -> None:
+            if not late_client.done():
+                late_client.set_result(None)
+
+        def _on_late_state(state) -> None:
+            if state == rtc.ConnectionState.CONN_DISCONNECTED:
+                _on_room_gone()
+
+        ctx.room.on("participant_connected", _on_late_join)
+        ctx.room.on("disconnected", _on_room_gone)
+        ctx.room.on("connection_state_changed", _on_late_state)
+        try:
+            # Handle a client (or a disconnect) that landed before the handlers did
+            for participant in list(ctx.room.remote_participants.values()):
+                _on_late_join(participant)
+            _on_late_state(ctx.room.connection_state)
+            late_participant = await late_client
+        finally:
+            ctx.room.off("participant_connected", _on_late_join)
+            ctx.room.off("disconnected", _on_room_gone)
+            ctx.room.off("connection_state_changed", _on_late_state)
+
+        if late_participant is not None:
+            # Client finally connected - but we can't re-link the session
+            # The session was already started without a participant
+            # Audio from client won't be received, but at least agent stays alive
+            logger.info("Client connected late: %s", late_participant.identity)
+        else:
+            logger.info("Room disconnected, exiting")
     else:
         # Client was linked - wait for session to naturally close
         # This happens when the linked participant leaves
@@ -2259,15 +2499,32 @@ async def entrypoint(ctx: JobContext):
     _session_summary: str = ""
     _session_n_calls: int = 0
     _session_msg_count: int = 0
+    # The room closes when all participants leave or it times out. Wake on the
+    # room's own events rather than re-checking connection_state every second.
+    # Only a real disconnect is terminal — CONN_RECONNECTING is a transient
+    # network blip the room recovers from, so it must not end the session.
+    room_closed = asyncio.Event()
+
+    def _on_room_closed(*_args) -> None:
+        room_closed.set()
+
+    def _on_connection_state(state) -> None:
+        if state == rtc.ConnectionState.CONN_DISCONNECTED:
+            room_closed.set()
+
+    ctx.room.on("disconnected", _on_room_closed)
+    ctx.room.on("connection_state_changed", _on_connection_state)
     try:
-        # The room closes when all participants leave or it times out
-        while ctx.room.connection_state == rtc.ConnectionState.CONN_CONNECTED:
-            await asyncio.sleep(1.0)
+        if ctx.room.connection_state != rtc.ConnectionState.CONN_DISCONNECTED:
+            await room_closed.wait()
     except asyncio.CancelledError:
         logger.info("[SessionCleanup] Entrypoint cancelled by LiveKit framework — running cleanup")
         # Re-raise after cleanup block executes (in finally)
         raise
     finally:
+        ctx.room.off("disconnected", _on_room_closed)
+        ctx.room.off("connection_state_changed", _on_connection_state)
+
         # Signal DLQ consumer to stop (if it was started)
         if "_dlq_stop_event" in dir():
             _dlq_stop_event.set()
@@ -72,6 +72,10 @@ class Settings(BaseSettings):
     memory_dir: str = Field(default="/app/data/memory", alias="AIO_MEMORY_DIR")
     models_dir: str = Field(default="/app/models", alias="AIO_MODELS_DIR")
 
+    # Diagnostics
+    # Per-frame RMS/dB stats on subscribed mic tracks (off in production)
+    debug_audio_rms: bool = Field(default=False, alias="AIO_DEBUG_AUDIO_RMS")
+
     @field_validator("livekit_url")
     @classmethod
     def validate_livekit_url(cls, v: str) -> str:
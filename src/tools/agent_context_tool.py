@@ -412,10 +412,12 @@ async def get_session_summary_tool(
 # Cache Management Functions (for agent lifecycle)
 # -------------------------------------------------------------------------
 
-async def warm_session_cache(session_id: str) -> None:
+async def warm_session_cache(session_id: str, ttl: float = 300.0) -> None:
     """Pre-warm cache with session context at session start.
 
-    Call this when the agent joins a room to pre-fetch context.
+    Call this when the agent joins a room to pre-fetch context. Callers that
+    warm well before the first use (e.g. before waiting on the client) pass a
+    longer ttl so the entry is still live when it is read.
     """
     logger.info(f"Pre-warming cache for session: {session_id}")
     try:
@@ -425,7 +427,7 @@ async def warm_session_cache(session_id: str) -> None:
             limit=50
         )
         cache_manager = get_cache_manager()
-        cache_manager.set_session_context(session_id, result, ttl=300.0)
+        cache_manager.set_session_context(session_id, result, ttl=ttl)
         logger.info(f"Cache pre-warmed for session: {session_id}")
     except Exception as e:
         logger.warning(f"Failed to pre-warm cache: {e}")
@@ -2788,6 +2788,10 @@ async def initiate_service_connection(service: str, force_reauth: bool = False)
     return f"Connection setup for {display_name} is temporarily unavailable — all initiation paths failed. Please try again in a moment.", ""
 
 
+# Upper bound on concurrent Composio calls within one batch step
+_BATCH_MAX_CONCURRENT = 8
+
+
 async def batch_execute_composio_tools(tools: list) -> str:
     """Execute multiple Composio tools in parallel via SDK.
 
@@ -2814,30 +2818,32 @@ async def batch_execute_composio_tools(tools: list) -> str:
     # does not block the entire batch. asyncio.TimeoutError is caught here and
     # converted to an informative string — the results loop below sees a str,
     # not an exception, so no special-case handling is needed there.
-    async def _with_batch_timeout(coro, slug: str):
-        try:
-            return await asyncio.wait_for(coro, timeout=35.0)
-        except asyncio.TimeoutError:
-            logger.warning(f"[Batch] Tool {slug} timed out in batch execution")
-            return f"[{_friendly_name(slug)}] timed out. Try this tool individually or try again."
-
-    tasks = [
-        _with_batch_timeout(
-            execute_composio_tool(
-                tool_slug=t.get("tool_slug", ""),
-                arguments=t.get("arguments", {}),
-            ),
-            t.get("tool_slug", "unknown"),
-        )
-        for t in tools
-        if t.get("tool_slug")
-    ]
+    # At most _BATCH_MAX_CONCURRENT calls are in flight against Composio at once;
+    # the timeout covers execution only, not time spent waiting for a slot.
+    slots = asyncio.Semaphore(_BATCH_MAX_CONCURRENT)
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    async def _with_batch_timeout(slug: str, arguments: dict):
+        async with slots:
+            try:
+                return await asyncio.wait_for(
+                    execute_composio_tool(tool_slug=slug, arguments=arguments),
+                    timeout=35.0,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"[Batch] Tool {slug} timed out in batch execution")
+                return f"[{_friendly_name(slug)}] timed out. Try this tool individually or try again."
+
+    # Specs without a slug are skipped; zip against the same filtered list so
+    # each result stays paired with the spec that produced it.
+    specs = [t for t in tools if t.get("tool_slug")]
+    results = await asyncio.gather(
+        *(_with_batch_timeout(t["tool_slug"], t.get("arguments", {})) for t in specs),
+        return_exceptions=True,
+    )
 
     duration_ms = int(time.time() * 1000) - start_ms
     summaries = []
-    for tool_spec, result in zip(tools, results):
+    for tool_spec, result in zip(specs, results):
         slug = tool_spec.get("tool_slug", "unknown")
         display = _friendly_name(slug)
         if isinstance(result, Exception):
@@ -23,8 +23,17 @@ from typing import Any, Callable, Optional
 
 import httpx
 
+try:
+    import orjson
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+    # except clauses keep working with either parser.
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from ..config import get_settings
 from ..prompts import TOOL_SYSTEM_PROMPT
+from ..utils.http_client import get_http_client, warm_http_client
 from ..utils.session_facts import store_fact
 from ..utils.session_manager import (
     get_or_create_lock as _sm_get_lock,
@@ -620,7 +629,7 @@ async def run_background_delegation(session_id: str, request: str, context_hints
                     session_id=session_id,
                 )
     except asyncio.TimeoutError:
-        logger.error(f"[bg_delegation] Delegation timed out after 300s session={session_id}")
+        logger.error("[bg_delegation] Delegation timed out after 300s session=%s", session_id)
         session = _sm_get_session(session_id)
         if session:
             await _announce_tool_result(
@@ -629,9 +638,9 @@ async def run_background_delegation(session_id: str, request: str, context_hints
                 session_id=session_id,
             )
     except asyncio.CancelledError:
-        logger.info(f"[bg_delegation] Task cancelled session={session_id}")
+        logger.info("[bg_delegation] Task cancelled session=%s", session_id)
     except Exception as e:
-        logger.error(f"[bg_delegation] Delegation failed session={session_id}: {e}")
+        logger.error("[bg_delegation] Delegation failed session=%s: %s", session_id, e)
         session = _sm_get_session(session_id)
         if session:
             await _announce_tool_result(
@@ -683,7 +692,7 @@ async def evaluate_and_execute_from_speech(
             timeout=300.0,
         )
     except asyncio.TimeoutError:
-        logger.error(f"[speech_eval] Timed out after 300s session={session_id}")
+        logger.error("[speech_eval] Timed out after 300s session=%s", session_id)
         _session = _sm_get_session(session_id)
         if _session:
             await _announce_tool_result(
@@ -693,10 +702,10 @@ async def evaluate_and_execute_from_speech(
             )
         return
     except asyncio.CancelledError:
-        logger.info(f"[speech_eval] Cancelled session={session_id}")
+        logger.info("[speech_eval] Cancelled session=%s", session_id)
         return
     except Exception as e:
-        logger.error(f"[speech_eval] Error session={session_id}: {e}")
+        logger.error("[speech_eval] Error session=%s: %s", session_id, e)
         return
 
     # Announce result via conversation session
@@ -736,6 +745,11 @@ def cleanup_session(session_id: str) -> None:
     logger.debug("[tool_executor] Cleaned up session %s", session_id)
 
 
+async def warm_fireworks_connection() -> None:
+    """Pre-open the pooled Fireworks connection so the first delegation skips the handshake."""
+    await warm_http_client(_FIREWORKS_API_URL)
+
+
 # ---------------------------------------------------------------------------
 # Context trimming
 # ---------------------------------------------------------------------------
@@ -856,8 +870,9 @@ async def _call_fireworks_streaming(
     Returns:
         {"role": "assistant", "content": str|None, "tool_calls": [...]}
 
-    Fireworks delivers function call arguments in fragments keyed by call_id.
-    We accumulate all fragments before returning.
+    Fireworks delivers function call arguments in fragments tagged with the
+    call's stream index (the id arrives only on the first fragment). We
+    accumulate all fragments before returning.
     """
     settings = get_settings()
 
@@ -876,84 +891,89 @@ async def _call_fireworks_streaming(
     }
 
     content_parts: list[str] = []
-    # call_id → list of arg fragments
-    arg_buffer: dict[str, list[str]] = {}
-    # call_id → {id, name, index}
-    tool_calls_meta: dict[str, dict] = {}
+    # Parallel per-call slots (id, name, arg fragments) in arrival order.
+    # Only the first fragment of a call carries its id; later fragments carry
+    # just the stream index, so fragments are routed by index → slot.
+    tc_ids: list[str] = []
+    tc_names: list[str] = []
+    tc_args: list[list[str]] = []
+    slot_for_index: dict[int, int] = {}
 
     timeout = httpx.Timeout(60.0, connect=10.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        async with client.stream(
-            "POST",
-            _FIREWORKS_API_URL,
-            json=payload,
-            headers=headers,
-        ) as resp:
-            resp.raise_for_status()
-            async for raw_line in resp.aiter_lines():
-                line = raw_line.strip()
-                if not line:
-                    continue
-                if line == "data: [DONE]":
-                    break
-                if line.startswith("data: "):
-                    line = line[6:]
-                try:
-                    chunk = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                choices = chunk.get("choices", [])
-                if not choices:
-                    continue
-                delta = choices[0].get("delta", {})
-
-                # Accumulate content
-                if delta.get("content"):
-                    content_parts.append(delta["content"])
-
-                # Accumulate tool call fragments
-                for tc in delta.get("tool_calls", []):
-                    # Use call id if present, otherwise fall back to index-based key
-                    tc_id = tc.get("id") or f"idx_{tc.get('index', 0)}"
-                    if tc_id not in arg_buffer:
-                        arg_buffer[tc_id] = []
-                        tool_calls_meta[tc_id] = {
-                            "id": tc.get("id") or tc_id,
-                            "name": "",
-                            "index": tc.get("index", 0),
-                        }
-                    fn = tc.get("function", {})
-                    if fn.get("name"):
-                        tool_calls_meta[tc_id]["name"] = fn["name"]
-                    if fn.get("arguments"):
-                        arg_buffer[tc_id].append(fn["arguments"])
+    # Shared keep-alive (HTTP/2 when available) client — repeated delegation steps
+    # reuse one warm connection to Fireworks instead of a TLS handshake per call.
+    client = get_http_client()
+    async with client.stream(
+        "POST",
+        _FIREWORKS_API_URL,
+        json=payload,
+        headers=headers,
+        timeout=timeout,
+    ) as resp:
+        resp.raise_for_status()
+        async for raw_line in resp.aiter_lines():
+            line = raw_line.strip()
+            if not line:
+                continue
+            if line == "data: [DONE]":
+                break
+            if line.startswith("data: "):
+                line = line[6:]
+            try:
+                chunk = _json_loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            choices = chunk.get("choices", [])
+            if not choices:
+                continue
+            delta = choices[0].get("delta") or {}
+            content = delta.get("content")
+            tool_call_deltas = delta.get("tool_calls")
+
+            # Accumulate content
+            if content:
+                content_parts.append(content)
+
+            # Accumulate tool call fragments
+            for tc in tool_call_deltas or ():
+                index = tc.get("index", 0)
+                call_id = tc.get("id")
+                slot = slot_for_index.get(index)
+                # New index, or a different call id reusing an index → new slot
+                if slot is None or (call_id and tc_ids[slot] and call_id != tc_ids[slot]):
+                    slot = len(tc_ids)
+                    slot_for_index[index] = slot
+                    tc_ids.append("")
+                    tc_names.append("")
+                    tc_args.append([])
+                if call_id:
+                    tc_ids[slot] = call_id
+                fn = tc.get("function", {})
+                if fn.get("name"):
+                    tc_names[slot] = fn["name"]
+                if fn.get("arguments"):
+                    tc_args[slot].append(fn["arguments"])
 
-    # Assemble final tool_calls list
+    # Assemble final tool_calls list (slots are already in stream order)
     assembled_tool_calls: list[dict] = []
-    for tc_id, fragments in arg_buffer.items():
+    for slot, fragments in enumerate(tc_args):
         raw_args = "".join(fragments)
         try:
-            args = json.loads(raw_args) if raw_args else {}
+            args = _json_loads(raw_args) if raw_args else {}
         except json.JSONDecodeError:
             args = {"_raw": raw_args}
-        meta = tool_calls_meta[tc_id]
         assembled_tool_calls.append(
             {
-                "id": meta["id"],
+                "id": tc_ids[slot] or f"idx_{slot}",
                 "type": "function",
                 "function": {
-                    "name": meta["name"],
+                    "name": tc_names[slot],
                     "arguments": json.dumps(args),
                 },
             }
         )
 
-    # Sort by original index for deterministic order
-    assembled_tool_calls.sort(
-        key=lambda tc: tool_calls_meta.get(tc["id"], {}).get("index", 0)
-    )
-
     return {
         "role": "assistant",
         "content": "".join(content_parts) if content_parts else None,
@@ -1392,32 +1412,60 @@ async def delegate_tools(
             tool_results: list[dict] = []
             gate_result: Optional[str] = None
 
+            parsed_calls: list[tuple[str, str, dict]] = []
             for tc in tool_calls:
                 fn = tc.get("function", {})
                 tool_name = fn.get("name", "")
                 try:
                     raw_args = fn.get("arguments", "{}")
-                    tool_args = json.loads(raw_args) if isinstance(raw_args, str) else raw_args
+                    tool_args = _json_loads(raw_args) if isinstance(raw_args, str) else raw_args
                 except json.JSONDecodeError:
                     tool_args = {}
+                parsed_calls.append((tc.get("id", ""), tool_name, tool_args))
 
-                # Execute (gate check inline for requestGate)
-                tool_result = await _dispatch_tool_call(tool_name, tool_args, session_id)
+            if any(name == "requestGate" for _, name, _ in parsed_calls):
+                # Gate present — keep call order so nothing after the gate runs
+                # before the user confirms.
+                for call_id, tool_name, tool_args in parsed_calls:
+                    tool_result = await _dispatch_tool_call(tool_name, tool_args, session_id)
 
-                result_content = str(tool_result) if tool_result is not None else ""
+                    result_content = str(tool_result) if tool_result is not None else ""
 
-                # Check for gate sentinel
-                if result_content.startswith(_GATE_SENTINEL):
-                    gate_result = result_content
-                    break
+                    # Check for gate sentinel
+                    if result_content.startswith(_GATE_SENTINEL):
+                        gate_result = result_content
+                        break
 
-                tool_results.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": tc.get("id", ""),
-                        "content": result_content,
-                    }
+                    tool_results.append(
+                        {
+                            "role": "tool",
+                            "tool_call_id": call_id,
+                            "content": result_content,
+                        }
+                    )
+            else:
+                # Independent calls — run concurrently: wall time is the slowest
+                # call rather than the sum of all of them.
+                outcomes = await asyncio.gather(
+                    *(
+                        _dispatch_tool_call(tool_name, tool_args, session_id)
+                        for _, tool_name, tool_args in parsed_calls
+                    ),
+                    return_exceptions=True,
                 )
+                for (call_id, tool_name, _), tool_result in zip(parsed_calls, outcomes):
+                    if isinstance(tool_result, BaseException):
+                        logger.error("[tool_executor] %s raised: %s", tool_name, tool_result)
+                        result_content = f"Tool {tool_name} error: {str(tool_result)[:200]}"
+                    else:
+                        result_content = str(tool_result) if tool_result is not None else ""
+                    tool_results.append(
+                        {
+                            "role": "tool",
+                            "tool_call_id": call_id,
+                            "content": result_content,
+                        }
+                    )
 
             # Gate intercept — return sentinel immediately
             if gate_result is not None:
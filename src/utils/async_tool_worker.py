@@ -5,6 +5,8 @@ Architecture:
 - Worker processes tools in background
 - Results published via LiveKit data channel
 - Agent can continue conversation while tools execute
+- Synchronous (blocking) tool bodies run on a small thread pool, with the
+  caller's ContextVars copied in, so they never stall the audio event loop
 
 This eliminates awkward silence during long-running operations like:
 - Sending emails (15-30s)
@@ -12,13 +14,17 @@ This eliminates awkward silence during long-running operations like:
 - Google Drive operations (5-15s)
 """
 import asyncio
+import contextvars
+import functools
+import inspect
 import json
 import logging
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Coroutine, Optional
+from typing import Any, Callable, Coroutine, Optional, Union
 
 from livekit import rtc
 
@@ -32,13 +38,15 @@ class TaskStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolTask:
-    """A tool execution task."""
+    """A tool execution task (one per dispatch, so slotted)."""
     task_id: str
     tool_name: str
-    tool_func: Callable[..., Coroutine[Any, Any, str]]
+    tool_func: Callable[..., Union[str, Coroutine[Any, Any, str]]]
     kwargs: dict
+    call_id: str = ""  # correlates with publish_tool_start events
+    context: Optional[contextvars.Context] = None  # dispatcher's ContextVars
     created_at: float = field(default_factory=time.time)
     status: TaskStatus = TaskStatus.PENDING
     result: Optional[str] = None
@@ -79,6 +87,8 @@ class AsyncToolWorker:
         self._workers: list[asyncio.Task] = []
         self._running = False
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Threads for synchronous tool bodies (created in start())
+        self._pool: Optional[ThreadPoolExecutor] = None
 
         # Direct callback for results (avoids data channel self-publish issue)
         self.on_result: Optional[Callable[[dict], Coroutine[Any, Any, None]]] = None
@@ -89,6 +99,9 @@ class AsyncToolWorker:
             return
 
         self._running = True
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrent, thread_name_prefix="tool-worker"
+        )
 
         # Start worker coroutines
         for i in range(self.max_concurrent):
@@ -98,7 +111,7 @@ class AsyncToolWorker:
             )
             self._workers.append(worker)
 
-        logger.info(f"AsyncToolWorker started with {self.max_concurrent} workers")
+        logger.info("AsyncToolWorker started with %s workers", self.max_concurrent)
 
     async def stop(self) -> None:
         """Stop all workers gracefully."""
@@ -112,12 +125,16 @@ class AsyncToolWorker:
         await asyncio.gather(*self._workers, return_exceptions=True)
         self._workers.clear()
 
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
         logger.info("AsyncToolWorker stopped")
 
     async def dispatch(
         self,
         tool_name: str,
-        tool_func: Callable[..., Coroutine[Any, Any, str]],
+        tool_func: Callable[..., Union[str, Coroutine[Any, Any, str]]],
         kwargs: dict,
         call_id: Optional[str] = None,
     ) -> str:
@@ -127,7 +144,8 @@ class AsyncToolWorker:
 
         Args:
             tool_name: Human-readable name for logging/announcements
-            tool_func: Async function to execute
+            tool_func: Async function to execute (a plain function is run
+                on the worker's thread pool instead of the event loop)
             kwargs: Arguments for the tool function
             call_id: Optional external call_id for correlating with publish events
 
@@ -141,13 +159,14 @@ class AsyncToolWorker:
             tool_name=tool_name,
             tool_func=tool_func,
             kwargs=kwargs,
+            call_id=call_id or "",
+            context=contextvars.copy_context(),
         )
-        task._call_id = call_id or ""
 
         self._tasks[task_id] = task
         await self._queue.put(task)
 
-        logger.info(f"[TOOL_CALL] Dispatched: {tool_name} task_id={task_id}")
+        logger.info("[TOOL_CALL] Dispatched: %s task_id=%s", tool_name, task_id)
 
         return task_id
 
@@ -157,18 +176,13 @@ class AsyncToolWorker:
 
     async def _worker_loop(self, worker_id: int) -> None:
         """Worker loop that processes tasks from queue."""
-        logger.debug(f"Worker {worker_id} started")
+        logger.debug("Worker %s started", worker_id)
 
         while self._running:
             try:
-                # Wait for a task with timeout (allows graceful shutdown)
-                try:
-                    task = await asyncio.wait_for(
-                        self._queue.get(),
-                        timeout=1.0
-                    )
-                except asyncio.TimeoutError:
-                    continue
+                # Block until a task arrives — stop() cancels the worker, so no
+                # timeout polling is needed for shutdown.
+                task = await self._queue.get()
 
                 # Execute the tool
                 await self._execute_task(task, worker_id)
@@ -176,21 +190,21 @@ class AsyncToolWorker:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Worker {worker_id} error: {e}")
+                logger.error("Worker %s error: %s", worker_id, e)
 
-        logger.debug(f"Worker {worker_id} stopped")
+        logger.debug("Worker %s stopped", worker_id)
 
     async def _execute_task(self, task: ToolTask, worker_id: int) -> None:
         """Execute a single task and publish result."""
         task.status = TaskStatus.RUNNING
         start_time = time.time()
 
-        logger.info(f"[TOOL_CALL] Executing: {task.tool_name} task_id={task.task_id} worker={worker_id}")
+        logger.info("[TOOL_CALL] Executing: %s task_id=%s worker=%s", task.tool_name, task.task_id, worker_id)
 
         try:
             async with self._semaphore:
                 # Execute the actual tool function
-                result = await task.tool_func(**task.kwargs)
+                result = await self._call_tool(task)
 
                 task.status = TaskStatus.COMPLETED
                 task.result = result
@@ -198,8 +212,8 @@ class AsyncToolWorker:
 
                 duration = task.completed_at - start_time
                 logger.info(
-                    f"[TOOL_CALL] Completed: {task.tool_name} "
-                    f"duration={duration:.1f}s result={result[:120]}"
+                    "[TOOL_CALL] Completed: %s duration=%.1fs result=%.120s",
+                    task.tool_name, duration, result,
                 )
 
         except Exception as e:
@@ -207,18 +221,35 @@ class AsyncToolWorker:
             task.error = str(e)
             task.completed_at = time.time()
 
-            logger.error(f"[TOOL_CALL] Failed: {task.tool_name} error={e}")
+            logger.error("[TOOL_CALL] Failed: %s error=%s", task.tool_name, e)
 
         # Publish result to room
         await self._publish_result(task)
 
+    async def _call_tool(self, task: ToolTask) -> str:
+        """Await a coroutine tool; run a synchronous one on the thread pool.
+
+        The thread runs inside the context captured at dispatch() so ContextVars
+        (session id, user id) set by the dispatcher are visible to the tool.
+        """
+        if inspect.iscoroutinefunction(task.tool_func):
+            return await task.tool_func(**task.kwargs)
+        ctx = task.context or contextvars.copy_context()
+        result = await asyncio.get_running_loop().run_in_executor(
+            self._pool, functools.partial(ctx.run, task.tool_func, **task.kwargs)
+        )
+        # A wrapped async tool (e.g. a partial) hands back its coroutine
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
     async def _publish_result(self, task: ToolTask) -> None:
         """Notify result via callback and publish to room data channel."""
         # Build result message
         message = {
             "type": "tool_result",
             "task_id": task.task_id,
-            "call_id": getattr(task, "_call_id", ""),   # correlates with publish_tool_start events
+            "call_id": task.call_id,
             "tool_name": task.tool_name,
             "status": task.status.value,
             "result": task.result or "",
@@ -231,9 +262,9 @@ class AsyncToolWorker:
         if self.on_result:
             try:
                 await self.on_result(message)
-                logger.debug(f"Callback notified for {task.task_id}")
+                logger.debug("Callback notified for %s", task.task_id)
             except Exception as e:
-                logger.error(f"Callback failed for {task.task_id}: {e}")
+                logger.error("Callback failed for %s: %s", task.task_id, e)
 
         # Secondary: Also publish to room for external listeners (UI, etc.)
         try:
@@ -243,9 +274,9 @@ class AsyncToolWorker:
                     data,
                     topic=self.result_topic,
                 )
-                logger.debug(f"Published result for {task.task_id}")
+                logger.debug("Published result for %s", task.task_id)
         except Exception as e:
-            logger.error(f"Failed to publish result: {e}")
+            logger.error("Failed to publish result: %s", e)
 
 
 # Singleton instance (initialized in agent.py)
@@ -0,0 +1,64 @@
+"""Shared httpx client for outbound HTTPS calls.
+
+One AsyncClient per event loop so repeated calls to the same host reuse a warm
+TCP+TLS connection instead of paying a fresh handshake per request. HTTP/2 is
+enabled when the `h2` package is installed (httpx[http2]) — concurrent requests
+to the same host then multiplex over a single connection.
+
+Per-request timeouts are passed at the call site (client.stream(..., timeout=...)).
+"""
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401  (presence check only — httpx imports it itself)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# AsyncClient connection pools are bound to the loop that opened them, so the
+# client is cached together with its owning loop and rebuilt if the loop changes.
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient for the running event loop (created lazily)."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS)
+        _client_loop = loop
+        logger.info("[HttpClient] Shared client created (http2=%s)", _HTTP2_AVAILABLE)
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client. Safe to call when no client exists."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug("[HttpClient] Close failed (non-critical): %s", e)
+
+
+async def warm_http_client(url: str, timeout: float = 5.0) -> None:
+    """Open a pooled connection to url's host ahead of the first real request.
+
+    Sends a HEAD and ignores the status — the point is the TCP+TLS handshake
+    (and HTTP/2 negotiation), which then stays in the keep-alive pool.
+    """
+    try:
+        await get_http_client().head(url, timeout=timeout)
+        logger.debug("[HttpClient] Warmed connection to %s", url)
+    except Exception as e:
+        logger.debug("[HttpClient] Warm-up failed (non-critical): %s", e)
@@ -181,6 +181,9 @@ class SecurityEventLogger:
 def setup_logging(name: Optional[str] = None, level: str = "INFO") -> structlog.BoundLogger:
     """Configure structured logging.
 
+    The returned logger formats positional args ("... %s", value) only when
+    the level is enabled — prefer them over f-strings on frequent paths.
+
     Args:
         name: Logger name (usually __name__)
         level: Log level (DEBUG, INFO, WARNING, ERROR)
@@ -8,7 +8,7 @@ import structlog
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class LatencyTracker:
     """Track latency across pipeline stages."""
 
@@ -42,7 +42,7 @@ class LatencyTracker:
         self._completed.clear()
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricsCollector:
     """Collect and report metrics."""
 
@@ -2,13 +2,49 @@
 
 Automatically injects X-AIO-Webhook-Secret and Content-Type headers
 on every request. All tool files use this instead of raw aiohttp.
+
+Requests share one pooled ClientSession per event loop, so consecutive
+webhook calls reuse keep-alive connections to the n8n host instead of
+paying a fresh TCP+TLS handshake each time.
 """
+import asyncio
 import logging
+from typing import Optional
+
 import aiohttp
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# ClientSession connectors are bound to the loop that created them, so the
+# session is cached with its owning loop and rebuilt if the loop changes.
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared ClientSession for the running event loop (created lazily)."""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30),
+        )
+        _session_loop = loop
+        logger.info("[n8n_client] Shared session created")
+    return _session
+
+
+async def close_n8n_session() -> None:
+    """Close the shared session. Safe to call when no session exists."""
+    global _session, _session_loop
+    session, _session, _session_loop = _session, None, None
+    if session is not None and not session.closed:
+        try:
+            await session.close()
+        except Exception as e:
+            logger.debug("[n8n_client] Close failed (non-critical): %s", e)
+
 
 async def n8n_post(path: str, payload: dict, timeout: int = 30) -> tuple[int, dict]:
     """POST to an n8n webhook with auth headers automatically injected.
@@ -29,11 +65,10 @@ async def n8n_post(path: str, payload: dict, timeout: int = 30) -> tuple[int, di
         "Content-Type": "application/json",
         "X-AIO-Webhook-Secret": settings.n8n_webhook_secret,
     }
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            url,
-            json=payload,
-            headers=headers,
-            timeout=aiohttp.ClientTimeout(total=timeout),
-        ) as response:
-            return response.status, await response.json()
+    async with _get_session().post(
+        url,
+        json=payload,
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as response:
+        return response.status, await response.json()
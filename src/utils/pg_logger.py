@@ -44,7 +44,7 @@ async def init_pool(postgres_url: str) -> None:
     except ImportError:
         logger.warning("[PgLogger] asyncpg not installed — conversation logging disabled")
     except Exception as e:
-        logger.warning(f"[PgLogger] Pool init failed: {e} — conversation logging disabled")
+        logger.warning("[PgLogger] Pool init failed: %s — conversation logging disabled", e)
 
 
 async def log_turn(
@@ -71,7 +71,7 @@ async def log_turn(
                 user_id,
             )
     except Exception as e:
-        logger.debug(f"[PgLogger] Turn log failed (non-critical): {e}")
+        logger.debug("[PgLogger] Turn log failed (non-critical): %s", e)
 
 
 async def log_session_start(
@@ -92,7 +92,7 @@ async def log_session_start(
                 session_id, user_id, room_name,
             )
     except Exception as e:
-        logger.debug(f"log_session_start error: {e}")
+        logger.debug("log_session_start error: %s", e)
 
 
 async def log_session_end(
@@ -120,7 +120,7 @@ async def log_session_end(
                 session_id, user_id, summary, message_count, tool_call_count,
             )
     except Exception as e:
-        logger.debug(f"log_session_end error: {e}")
+        logger.debug("log_session_end error: %s", e)
 
 
 async def log_tool_error(
@@ -164,7 +164,7 @@ async def log_tool_error(
                 user_id,
             )
     except Exception as e:
-        logger.debug(f"[PgLogger] tool_error_log insert failed (non-critical): {e}")
+        logger.debug("[PgLogger] tool_error_log insert failed (non-critical): %s", e)
 
 
 async def _get_pool():
@@ -198,7 +198,7 @@ async def save_session_context(
                 effective_expires,
             )
     except Exception as e:
-        logger.debug(f"[PgLogger] save_session_context failed (non-critical): {e}")
+        logger.debug("[PgLogger] save_session_context failed (non-critical): %s", e)
 
 
 async def get_session_context(session_id: str, context_key: str) -> Optional[str]:
@@ -218,7 +218,7 @@ async def get_session_context(session_id: str, context_key: str) -> Optional[str
             )
             return row["context_value"] if row else None
     except Exception as e:
-        logger.debug(f"[PgLogger] get_session_context failed (non-critical): {e}")
+        logger.debug("[PgLogger] get_session_context failed (non-critical): %s", e)
         return None
 
 
@@ -239,7 +239,7 @@ async def get_session_gates(session_id: str) -> list:
             )
             return [{"key": r["context_key"], "value": r["context_value"]} for r in rows]
     except Exception as e:
-        logger.debug(f"[PgLogger] get_session_gates failed (non-critical): {e}")
+        logger.debug("[PgLogger] get_session_gates failed (non-critical): %s", e)
         return []
 
 
@@ -255,7 +255,7 @@ async def clear_session_context(session_id: str, context_key: str) -> None:
                 full_key,
             )
     except Exception as e:
-        logger.debug(f"[PgLogger] clear_session_context failed (non-critical): {e}")
+        logger.debug("[PgLogger] clear_session_context failed (non-critical): %s", e)
 
 
 async def close_pool() -> None:
@@ -50,18 +50,16 @@ async def _publish(data: dict) -> bool:
         await _room.local_participant.publish_data(payload)
         return True
     except Exception as e:
-        logger.debug(f"Room publish failed: {e}")
+        logger.debug("Room publish failed: %s", e)
         return False
 
 
 def _publish_fire_and_forget(data: dict) -> None:
     """Schedule publish without awaiting — for use in sync contexts."""
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            asyncio.ensure_future(_publish(data))
+        asyncio.get_running_loop().create_task(_publish(data))
     except RuntimeError:
-        pass
+        pass  # no running loop — nothing to schedule on
 
 
 async def publish_tool_start(tool_name: str, arguments: Optional[dict] = None) -> str:
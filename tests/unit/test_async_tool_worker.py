@@ -0,0 +1,95 @@
+"""Unit tests for src/utils/async_tool_worker.py
+
+Tests verify:
+- Coroutine tools are awaited on the event loop
+- Synchronous tools run on the worker's thread pool, not the loop thread
+- ContextVars set by the dispatcher are visible inside a threaded tool
+"""
+
+import asyncio
+import contextvars
+import threading
+import pytest
+from unittest.mock import MagicMock
+
+# ── Import guard ──────────────────────────────────────────────────────────────
+try:
+    from src.utils.async_tool_worker import AsyncToolWorker
+    IMPORTS_OK = True
+except Exception:  # livekit not installed
+    IMPORTS_OK = False
+
+pytestmark = pytest.mark.skipif(not IMPORTS_OK, reason="async_tool_worker not importable")
+
+_session = contextvars.ContextVar("_session", default="")
+
+
+def run(coro):
+    """Run a coroutine on a private loop (leaves the thread's current loop alone)."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+async def run_one(tool_func, session="", **kwargs) -> dict:
+    """Dispatch a single tool through a fresh worker and return its result message.
+
+    ``session`` is set on the ContextVar after the worker starts, just before
+    dispatch — as the tool wrappers do per call.
+    """
+    room = MagicMock()
+    room.local_participant = None  # skip the data-channel publish
+    worker = AsyncToolWorker(room=room, max_concurrent=2)
+    done: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    async def on_result(message):
+        done.set_result(message)
+
+    worker.on_result = on_result
+    await worker.start()
+    try:
+        _session.set(session)
+        await worker.dispatch("tool", tool_func, kwargs)
+        return await asyncio.wait_for(done, timeout=2.0)
+    finally:
+        await worker.stop()
+
+
+class TestToolExecution:
+
+    def test_coroutine_tool_is_awaited(self):
+        async def tool(x):
+            await asyncio.sleep(0)
+            return f"async {x}"
+
+        message = run(run_one(tool, x=1))
+        assert message["status"] == "completed"
+        assert message["result"] == "async 1"
+
+    def test_sync_tool_runs_off_loop_thread(self):
+        loop_thread = threading.get_ident()
+        seen = {}
+
+        def tool():
+            seen["thread"] = threading.get_ident()
+            return "sync ok"
+
+        message = run(run_one(tool))
+        assert message["result"] == "sync ok"
+        assert seen["thread"] != loop_thread
+
+    def test_sync_tool_sees_dispatcher_contextvars(self):
+        def tool():
+            return _session.get()
+
+        assert run(run_one(tool, session="room-42"))["result"] == "room-42"
+
+    def test_sync_tool_error_is_reported(self):
+        def tool():
+            raise ValueError("bad input")
+
+        message = run(run_one(tool))
+        assert message["status"] == "failed"
+        assert message["error"] == "bad input"
@@ -4,8 +4,11 @@ Tests are structured around 3 invariant categories:
   1. CB bypass - COMPOSIO_MANAGE_* bypass circuit breaker; _CB_TRIPPED_PREFIX sentinel present
   2. Gamma URL extraction - _extract_voice_result returns gammaUrl for GAMMA slugs
   3. Slug overrides - All known ghost slugs mapped in _SLUG_OVERRIDES
+  4. Batch execution - concurrency cap and result/spec pairing
 """
+import asyncio
 import pytest
+from unittest.mock import AsyncMock, patch
 
 # Import from composio_router
 try:
@@ -126,3 +129,63 @@ class TestSlugOverrides:
         """Exactly all 7 expected ghost slugs are present in _SLUG_OVERRIDES."""
         missing = [k for k in self._EXPECTED_OVERRIDES if k not in _SLUG_OVERRIDES]
         assert not missing, f"Missing ghost slug overrides: {missing}"
+
+
+# ---------------------------------------------------------------------------
+# Category 4: Batch Execution
+# ---------------------------------------------------------------------------
+
+def run(coro):
+    """Run a coroutine on a private loop (leaves the thread's current loop alone)."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestBatchExecute:
+    """batch_execute_composio_tools runs a step group concurrently, within a cap."""
+
+    def _run_batch(self, tools, fake_execute):
+        import src.tools.composio_router as _mod
+
+        with patch.object(_mod, "execute_composio_tool", fake_execute), \
+                patch.object(_mod, "publish_tool_start", AsyncMock(return_value="call-1")), \
+                patch.object(_mod, "publish_tool_executing", AsyncMock()), \
+                patch.object(_mod, "publish_tool_completed", AsyncMock()):
+            return run(_mod.batch_execute_composio_tools(tools))
+
+    def test_concurrency_is_capped(self):
+        import src.tools.composio_router as _mod
+
+        running = 0
+        peak = 0
+
+        async def fake_execute(tool_slug, arguments):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return f"{tool_slug} ok"
+
+        tools = [{"tool_slug": f"TOOL_{i}", "arguments": {}} for i in range(_mod._BATCH_MAX_CONCURRENT + 4)]
+        self._run_batch(tools, fake_execute)
+        assert peak == _mod._BATCH_MAX_CONCURRENT
+
+    def test_results_stay_paired_when_a_spec_has_no_slug(self):
+        async def fake_execute(tool_slug, arguments):
+            if tool_slug == "BAD_TOOL":
+                raise RuntimeError("boom")
+            return f"{tool_slug} ok"
+
+        import src.tools.composio_router as _mod
+
+        tools = [
+            {"arguments": {}},
+            {"tool_slug": "BAD_TOOL", "arguments": {}},
+            {"tool_slug": "GOOD_TOOL", "arguments": {}},
+        ]
+        summary = self._run_batch(tools, fake_execute)
+        assert summary == f"{_mod._friendly_name('BAD_TOOL')} failed and GOOD_TOOL ok"
@@ -0,0 +1,89 @@
+"""Unit tests for the Fireworks SSE parser in src/tools/tool_executor.py
+
+Tests verify:
+- Argument fragments without an id are joined onto the call that opened the index
+- Parallel tool calls come back in stream order with their own arguments
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+
+# ── Import guard ──────────────────────────────────────────────────────────────
+try:
+    import httpx
+    from src.tools import tool_executor
+    IMPORTS_OK = True
+except Exception:  # missing deps or unconfigured settings
+    IMPORTS_OK = False
+
+pytestmark = pytest.mark.skipif(not IMPORTS_OK, reason="tool_executor not importable")
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+def sse_body(*deltas):
+    lines = [
+        "data: " + json.dumps({"choices": [{"delta": d}]}) for d in deltas
+    ]
+    lines.append("data: [DONE]")
+    return ("\n\n".join(lines) + "\n\n").encode()
+
+
+def frag(index, args, call_id=None, name=None):
+    fn = {"arguments": args}
+    if name:
+        fn["name"] = name
+    tc = {"index": index, "function": fn}
+    if call_id:
+        tc["id"] = call_id
+    return {"tool_calls": [tc]}
+
+
+def run(coro):
+    """Run a coroutine on a private loop (leaves the thread's current loop alone)."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def stream(body):
+    """Run _call_fireworks_streaming against a canned SSE body."""
+    async def _run():
+        transport = httpx.MockTransport(lambda req: httpx.Response(200, content=body))
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch.object(tool_executor, "get_http_client", lambda: client):
+                return await tool_executor._call_fireworks_streaming([], [], "s")
+    return run(_run())
+
+
+# ── Parser tests ──────────────────────────────────────────────────────────────
+
+class TestToolCallAssembly:
+
+    def test_id_only_on_first_fragment(self):
+        msg = stream(sse_body(
+            frag(0, '{"to": ', call_id="call_a", name="sendEmail"),
+            frag(0, '"a@b.c"}'),
+        ))
+        assert len(msg["tool_calls"]) == 1
+        tc = msg["tool_calls"][0]
+        assert tc["id"] == "call_a"
+        assert tc["function"]["name"] == "sendEmail"
+        assert json.loads(tc["function"]["arguments"]) == {"to": "a@b.c"}
+
+    def test_parallel_calls_keep_stream_order(self):
+        msg = stream(sse_body(
+            frag(0, "", call_id="call_a", name="listFiles"),
+            frag(1, "", call_id="call_b", name="searchEmails"),
+            frag(1, '{"q": "x"}'),
+            frag(0, '{"n": 1}'),
+            {"content": "ok"},
+        ))
+        assert msg["content"] == "ok"
+        assert [tc["id"] for tc in msg["tool_calls"]] == ["call_a", "call_b"]
+        assert json.loads(msg["tool_calls"][0]["function"]["arguments"]) == {"n": 1}
+        assert json.loads(msg["tool_calls"][1]["function"]["arguments"]) == {"q": "x"}
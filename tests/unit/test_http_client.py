@@ -0,0 +1,75 @@
+"""Unit tests for src/utils/http_client.py
+
+Tests verify:
+- get_http_client returns one shared client per event loop
+- A new loop (or a closed client) gets a fresh client
+- close_http_client is idempotent
+- warm_http_client never raises
+"""
+
+import asyncio
+import pytest
+
+# ── Import guard ──────────────────────────────────────────────────────────────
+try:
+    import src.utils.http_client as http_client
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+pytestmark = pytest.mark.skipif(not IMPORTS_OK, reason="httpx not importable")
+
+
+def run(coro):
+    """Run a coroutine on a private loop (leaves the thread's current loop alone)."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestSharedClient:
+
+    def test_same_client_within_loop(self):
+        async def _run():
+            try:
+                return http_client.get_http_client() is http_client.get_http_client()
+            finally:
+                await http_client.close_http_client()
+
+        assert run(_run()) is True
+
+    def test_new_loop_gets_new_client(self):
+        async def _get():
+            return http_client.get_http_client()
+
+        first = run(_get())
+        second = run(_get())
+        assert first is not second
+        run(http_client.close_http_client())
+
+    def test_closed_client_is_replaced(self):
+        async def _run():
+            first = http_client.get_http_client()
+            await first.aclose()
+            second = http_client.get_http_client()
+            await http_client.close_http_client()
+            return first is not second
+
+        assert run(_run()) is True
+
+    def test_close_without_client_is_noop(self):
+        run(http_client.close_http_client())
+        run(http_client.close_http_client())
+        assert http_client._client is None
+
+    def test_warm_up_failure_is_swallowed(self):
+        async def _run():
+            try:
+                # Unroutable port — connect fails fast; warm-up must not raise
+                await http_client.warm_http_client("http://127.0.0.1:9/", timeout=0.5)
+            finally:
+                await http_client.close_http_client()
+
+        run(_run())
@@ -0,0 +1,64 @@
+"""Unit tests for src/utils/n8n_client.py
+
+Tests verify:
+- n8n webhook calls share one ClientSession per event loop
+- A new loop (or a closed session) gets a fresh session
+- close_n8n_session is idempotent
+"""
+
+import asyncio
+import pytest
+
+# ── Import guard ──────────────────────────────────────────────────────────────
+try:
+    import src.utils.n8n_client as n8n_client
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+pytestmark = pytest.mark.skipif(not IMPORTS_OK, reason="aiohttp not importable")
+
+
+def run(coro):
+    """Run a coroutine on a private loop (leaves the thread's current loop alone)."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestSharedSession:
+
+    def test_same_session_within_loop(self):
+        async def _run():
+            try:
+                return n8n_client._get_session() is n8n_client._get_session()
+            finally:
+                await n8n_client.close_n8n_session()
+
+        assert run(_run()) is True
+
+    def test_new_loop_gets_new_session(self):
+        async def _get():
+            return n8n_client._get_session()
+
+        first = run(_get())
+        second = run(_get())
+        assert first is not second
+        run(n8n_client.close_n8n_session())
+
+    def test_closed_session_is_replaced(self):
+        async def _run():
+            first = n8n_client._get_session()
+            await first.close()
+            second = n8n_client._get_session()
+            await n8n_client.close_n8n_session()
+            return first is not second
+
+        assert run(_run()) is True
+
+    def test_close_without_session_is_noop(self):
+        run(n8n_client.close_n8n_session())
+        run(n8n_client.close_n8n_session())
+        assert n8n_client._session is None
@@ -0,0 +1,100 @@
+"""Unit tests for tool-call dispatch in src/tools/tool_executor.delegate_tools
+
+Tests verify:
+- Independent tool calls in one step run concurrently
+- A requestGate call keeps serial order and stops before later calls run
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+
+# ── Import guard ──────────────────────────────────────────────────────────────
+try:
+    from src.tools import tool_executor
+    IMPORTS_OK = True
+except Exception:  # missing deps or unconfigured settings
+    IMPORTS_OK = False
+
+pytestmark = pytest.mark.skipif(not IMPORTS_OK, reason="tool_executor not importable")
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+def run(coro):
+    """Run a coroutine on a private loop (leaves the thread's current loop alone)."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def tool_call(call_id, name, args=None):
+    return {"id": call_id, "function": {"name": name, "arguments": json.dumps(args or {})}}
+
+
+def scripted_llm(*messages):
+    """Return a fake _call_fireworks_streaming that replays messages in order."""
+    replies = list(messages)
+
+    async def _fake(ctx, schemas, session_id):
+        return replies.pop(0)
+
+    return _fake
+
+
+# ── Dispatch tests ────────────────────────────────────────────────────────────
+
+class TestParallelDispatch:
+    """Tool calls from one assistant turn."""
+
+    def test_independent_calls_overlap(self):
+        running = 0
+        peak = 0
+
+        async def fake_dispatch(name, args, session_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return f"{name} ok"
+
+        llm = scripted_llm(
+            {"role": "assistant", "content": None,
+             "tool_calls": [tool_call("a", "searchEmails"), tool_call("b", "listFiles")]},
+            {"role": "assistant", "content": "done"},
+        )
+        with patch.object(tool_executor, "_call_fireworks_streaming", llm), \
+                patch.object(tool_executor, "_dispatch_tool_call", fake_dispatch), \
+                patch.object(tool_executor, "store_fact", lambda *a, **k: None):
+            result = run(tool_executor.delegate_tools("par-1", "do both", {}))
+
+        assert result == "done"
+        assert peak == 2
+        ctx = tool_executor._tool_session_chat_ctx.pop("par-1")
+        tool_msgs = [m for m in ctx if m.get("role") == "tool"]
+        assert [m["tool_call_id"] for m in tool_msgs] == ["a", "b"]
+
+    def test_gate_stops_later_calls(self):
+        called = []
+
+        async def fake_dispatch(name, args, session_id):
+            called.append(name)
+            if name == "requestGate":
+                return f"{tool_executor._GATE_SENTINEL}{{}}"
+            return "sent"
+
+        llm = scripted_llm(
+            {"role": "assistant", "content": None,
+             "tool_calls": [tool_call("g", "requestGate"), tool_call("s", "sendEmail")]},
+        )
+        with patch.object(tool_executor, "_call_fireworks_streaming", llm), \
+                patch.object(tool_executor, "_dispatch_tool_call", fake_dispatch):
+            result = run(tool_executor.delegate_tools("par-2", "send it", {}))
+
+        tool_executor._tool_session_chat_ctx.pop("par-2", None)
+        assert result.startswith(tool_executor._GATE_SENTINEL)
+        assert called == ["requestGate"]